@@ -153,7 +153,7 @@ class AnnouncementManager:
         try:
             sound_file = self._event_sounds[event]
             logger.info(f"Playing announcement for event: {event}")
-            return self.player.play_async(sound_file)
+            return self.player.play_async(sound_file) is not None
             
         except Exception as e:
             logger.error(f"Error playing announcement: {e}")
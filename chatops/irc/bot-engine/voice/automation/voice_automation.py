@@ -2,7 +2,6 @@
 
 import logging
 import threading
-import time
 from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
@@ -129,8 +128,10 @@ class VoiceAutomation:
             logger.debug("Listening for wake word...")
             
             # In a real implementation, this would continuously monitor audio
-            # For now, we'll just sleep and check periodically
-            time.sleep(1)
+            # For now, we'll just wait and check periodically; waiting on
+            # the stop event lets stop() end the loop immediately
+            if self._stop_event.wait(1):
+                break
             
             # Check if wake word was detected
             # (In production, this would be event-driven)
@@ -1,6 +1,8 @@
 """Wake word detection for voice automation."""
 
 import logging
+import os
+import tempfile
 import time
 from typing import List, Optional
 import threading
@@ -124,17 +126,16 @@ class WakeWordDetector:
         try:
             if self.engine_name == "whisper":
                 # Use Whisper to transcribe and check for wake word
-                import tempfile
                 with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
                     f.write(audio_data)
                     temp_file = f.name
                 
-                result = self.engine.transcribe(temp_file)
+                try:
+                    result = self.engine.transcribe(temp_file)
+                finally:
+                    os.unlink(temp_file)
                 text = result.get("text", "").lower()
                 
-                import os
-                os.unlink(temp_file)
-                
                 for wake_word in self.wake_words:
                     if wake_word in text:
                         logger.info(f"Wake word detected: {wake_word}")
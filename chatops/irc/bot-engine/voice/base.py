@@ -56,8 +56,11 @@ class VoiceConfig:
     
     sample_rate: int = 16000
     channels: int = 1
+    # Frames per stream block; larger blocks mean fewer callbacks but add
+    # chunk_size / sample_rate seconds of latency (64 ms at the defaults)
     chunk_size: int = 1024
     device_index: Optional[int] = None
+    downmix_to_mono: bool = False  # Mix multi-channel recordings to mono
     
     # TTS settings
     tts_engine: str = "pyttsx3"  # pyttsx3, espeak, etc.
@@ -121,7 +124,8 @@ class VoiceEngine:
 class TTSConfig:
     """Text-to-speech configuration."""
     enabled: bool = True
-    engine: str = "pyttsx3"
+    engine: str = "pyttsx3"  # pyttsx3, piper or espeak
+    model_path: Optional[str] = None  # Piper voice model (.onnx)
     voice: Optional[str] = None  # Specific voice ID or None for default
     rate: int = 150  # Words per minute
     volume: float = 1.0  # 0.0 to 1.0
@@ -133,10 +137,17 @@ class TTSConfig:
 class STTConfig:
     """Speech-to-text configuration."""
     enabled: bool = True
-    engine: str = "whisper"
+    engine: str = "whisper"  # whisper (faster-whisper or openai-whisper), whispercpp or openvino
     model: str = "base"  # tiny, base, small, medium, large
     language: str = "en"
     device: str = "cpu"  # cpu or cuda
+    compute_type: Optional[str] = None  # None = int8 on CPU, int8_float16 on GPU; q5_1 for whispercpp
+    cpu_threads: int = 4  # faster-whisper CPU threads per worker
+    beam_size: int = 1  # faster-whisper; 1 = greedy decoding
+    vad_filter: bool = True  # faster-whisper; skip non-speech with its built-in VAD
+    vad_min_silence_ms: int = 500  # Silence that splits speech for vad_filter
+    model_cache_dir: Optional[str] = None  # faster-whisper; keep models pre-quantized here
+    preload_model: bool = False  # Load the model in the background at startup
 
 
 @dataclass
@@ -145,6 +156,8 @@ class RecorderConfig:
     enabled: bool = True
     sample_rate: int = 16000
     channels: int = 1
+    chunk_size: int = 1024  # Frames per stream block
+    device_index: Optional[int] = None
     format: str = "wav"  # wav, mp3, ogg
     vad_enabled: bool = True
     vad_aggressiveness: int = 2  # 0-3, higher = more aggressive
@@ -157,6 +170,11 @@ class PlayerConfig:
     enabled: bool = True
     volume: float = 0.8  # 0.0 to 1.0
     supported_formats: list = field(default_factory=lambda: ["wav", "mp3", "ogg"])
+    audio_pool_size: int = 2  # Worker threads for non-blocking playback
+    preload_files: list = field(default_factory=list)  # Prompts paged in at startup
+    # Set False only if play() is never called from more than one thread
+    # at a time (no play_async); skips locking the decode cache
+    thread_safe: bool = True
 
 
 @dataclass
@@ -355,11 +373,18 @@ class VoiceEngine:
             if not self._initialized:
                 self.initialize()
 
-            # Record audio
+            # Record audio and hand the samples to Whisper in memory rather
+            # than through a temp WAV that is decoded again from disk
             if self._recorder:
-                audio_file = self._recorder.record(duration)
-                if audio_file and self._stt_engine:
-                    return self._stt_engine.transcribe_file(audio_file)
+                audio = self._recorder.record(
+                    timeout=duration or 30,
+                    use_vad=duration is None,
+                    return_format='pcm'
+                )
+                if audio is not None and self._stt_engine:
+                    return self._stt_engine.transcribe_realtime(
+                        audio, self.config.recorder.sample_rate
+                    )
 
             return None
 
@@ -387,7 +412,7 @@ class VoiceEngine:
                 self.initialize()
 
             if self._recorder:
-                result = self._recorder.record(duration, filename)
+                result = self._recorder.record_to_file(duration, filename)
                 return result is not None
 
             return False
@@ -460,6 +485,12 @@ class VoiceEngine:
             except Exception as e:
                 logger.error(f"Error shutting down TTS: {e}")
 
+        if self._stt_engine:
+            try:
+                self._stt_engine.shutdown()
+            except Exception as e:
+                logger.error(f"Error shutting down STT: {e}")
+
         if self._player:
             try:
                 self._player.shutdown()
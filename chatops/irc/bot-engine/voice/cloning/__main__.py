@@ -1,6 +1,7 @@
 """CLI for voice cloning system."""
 import sys
 import argparse
+import glob
 import logging
 from pathlib import Path
 import os
@@ -25,14 +26,29 @@ bot_engine_path = parent_dir / "chatops" / "irc" / "bot-engine"
 voice_base = load_module("voice.base", bot_engine_path / "voice" / "base.py")
 voice_profile_module = load_module("voice.cloning.voice_profile", bot_engine_path / "voice" / "cloning" / "voice_profile.py")
 cloning_base = load_module("voice.cloning.base", bot_engine_path / "voice" / "cloning" / "base.py")
-xtts = load_module("voice.cloning.xtts_cloner", bot_engine_path / "voice" / "cloning" / "xtts_cloner.py")
-tortoise = load_module("voice.cloning.tortoise_cloner", bot_engine_path / "voice" / "cloning" / "tortoise_cloner.py")
-openvoice = load_module("voice.cloning.openvoice_cloner", bot_engine_path / "voice" / "cloning" / "openvoice_cloner.py")
-trainer = load_module("voice.cloning.trainer", bot_engine_path / "voice" / "cloning" / "trainer.py")
-voice_cloner_module = load_module("voice.cloning.voice_cloner", bot_engine_path / "voice" / "cloning" / "voice_cloner.py")
 
 VoiceCloningConfig = voice_base.VoiceCloningConfig
-VoiceCloner = voice_cloner_module.VoiceCloner
+VoiceProfileManager = voice_profile_module.VoiceProfileManager
+
+
+def load_voice_cloner():
+    """Load the cloning engines and VoiceCloner on first use.
+    
+    The engine modules are only needed by commands that record, train or
+    synthesize, so profile management commands never import them.
+    
+    Returns:
+        VoiceCloner class
+    """
+    module = sys.modules.get("voice.cloning.voice_cloner")
+    if module is None:
+        cloning_path = bot_engine_path / "voice" / "cloning"
+        load_module("voice.cloning.xtts_cloner", cloning_path / "xtts_cloner.py")
+        load_module("voice.cloning.tortoise_cloner", cloning_path / "tortoise_cloner.py")
+        load_module("voice.cloning.openvoice_cloner", cloning_path / "openvoice_cloner.py")
+        load_module("voice.cloning.trainer", cloning_path / "trainer.py")
+        module = load_module("voice.cloning.voice_cloner", cloning_path / "voice_cloner.py")
+    return module.VoiceCloner
 
 # Setup logging
 logging.basicConfig(
@@ -50,6 +66,7 @@ def cmd_record_samples(args):
         device=args.device
     )
     
+    VoiceCloner = load_voice_cloner()
     cloner = VoiceCloner(config)
     
     print("\n🎤 Voice Sample Recording")
@@ -72,19 +89,17 @@ def cmd_create_master(args):
         engine=args.engine
     )
     
+    VoiceCloner = load_voice_cloner()
     cloner = VoiceCloner(config)
     
     # Collect audio files
     audio_files = []
     for pattern in args.files:
-        path = Path(pattern)
-        if path.is_file():
-            audio_files.append(str(path))
+        if os.path.isfile(pattern):
+            audio_files.append(pattern)
         else:
-            # Handle glob patterns
-            parent = path.parent if path.parent.exists() else Path('.')
-            pattern_str = path.name
-            audio_files.extend([str(p) for p in parent.glob(pattern_str)])
+            # Handle glob patterns (scandir-based, stays in plain strings)
+            audio_files.extend(sorted(glob.iglob(pattern, recursive=True)))
     
     if not audio_files:
         print(f"❌ No audio files found matching: {args.files}")
@@ -106,12 +121,7 @@ def cmd_create_master(args):
 
 def cmd_list_profiles(args):
     """List all voice profiles."""
-    config = VoiceCloningConfig(
-        profiles_dir=args.profiles_dir
-    )
-    
-    cloner = VoiceCloner(config)
-    profiles = cloner.list_profiles()
+    profiles = VoiceProfileManager(args.profiles_dir).list_profiles()
     
     if not profiles:
         print("\nNo voice profiles found.")
@@ -136,6 +146,7 @@ def cmd_test(args):
         device=args.device
     )
     
+    VoiceCloner = load_voice_cloner()
     cloner = VoiceCloner(config)
     
     print(f"\n🔊 Testing master voice")
@@ -144,7 +155,7 @@ def cmd_test(args):
     output_file = args.output or "test_output.wav"
     
     try:
-        cloner.speak_as_master(args.text, output_file=output_file)
+        cloner.speak_as_master(args.text, output_file=output_file, return_bytes=False)
         print(f"\n✓ Audio generated: {output_file}")
     except ValueError as e:
         print(f"\n❌ Error: {e}")
@@ -153,22 +164,32 @@ def cmd_test(args):
 
 def cmd_set_master(args):
     """Set a profile as the master voice."""
-    config = VoiceCloningConfig(
-        profiles_dir=args.profiles_dir
-    )
-    
-    cloner = VoiceCloner(config)
+    profiles = VoiceProfileManager(args.profiles_dir)
     
-    try:
-        cloner.set_master_voice(args.name)
+    if profiles.set_master_voice(args.name):
         print(f"\n✓ Master voice set to: {args.name}")
-    except ValueError as e:
-        print(f"\n❌ Error: {e}")
+    else:
+        print(f"\n❌ Error: Profile not found: {args.name}")
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+_COMMANDS = {
+    'record-samples': cmd_record_samples,
+    'create-master': cmd_create_master,
+    'list-profiles': cmd_list_profiles,
+    'test': cmd_test,
+    'set-master': cmd_set_master,
+}
+
+_PARSER = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+    
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description="MasterChief IRC Bot Voice Cloning CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -267,23 +288,29 @@ def main():
         help='Name of the profile to set as master'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    """Main CLI entry point.
+    
+    Args:
+        argv: Optional argument list (defaults to sys.argv[1:])
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    parser = _PARSER
+    
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
     # Execute command
-    commands = {
-        'record-samples': cmd_record_samples,
-        'create-master': cmd_create_master,
-        'list-profiles': cmd_list_profiles,
-        'test': cmd_test,
-        'set-master': cmd_set_master,
-    }
-    
     try:
-        commands[args.command](args)
+        _COMMANDS[args.command](args)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user.")
         sys.exit(0)
@@ -1,14 +1,81 @@
 """Base interface for voice cloning engines."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import logging
+import os
+import shutil
 
 logger = logging.getLogger(__name__)
 
+# Linux ioctl request for copy-on-write file cloning (reflink)
+FICLONE = 0x40049409
+
+def ensure_dir(path: str) -> None:
+    """Create a directory and any missing parents if needed.
+    
+    Nothing is cached: directories can be removed behind our back, and
+    ``os.makedirs`` on an existing directory is a single ``stat``.
+    
+    Args:
+        path: Directory path
+    """
+    os.makedirs(path, exist_ok=True)
+
+
+def require(module, package: str):
+    """Check that an optional module-level import succeeded.
+    
+    Args:
+        module: Imported module, or None if its import failed
+        package: pip package that provides it
+        
+    Returns:
+        The module
+        
+    Raises:
+        ImportError: If the module is not installed
+    """
+    if module is None:
+        raise ImportError(f"{package} is required. Install with: pip install {package}")
+    return module
+
+
+def fast_copy(src: str, dst: str) -> None:
+    """Copy a file, sharing storage with the source where possible.
+    
+    Tries a hardlink first, then a copy-on-write reflink (btrfs/xfs), and
+    finally falls back to ``shutil.copy``, which uses kernel-side copies
+    (``sendfile``) on Linux.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path (replaced if it exists)
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    try:
+        import fcntl
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    
+    shutil.copy(src, dst)
+
 
 class BaseVoiceCloner(ABC):
     """Abstract base class for voice cloning implementations."""
     
+    __slots__ = ('config', 'device', 'model')
+    
     def __init__(self, config):
         """Initialize the voice cloner.
         
@@ -63,17 +130,20 @@ class BaseVoiceCloner(ABC):
         self,
         text: str,
         model_path: str,
-        output_file: Optional[str] = None
-    ) -> bytes:
+        output_file: Optional[str] = None,
+        return_bytes: bool = True
+    ) -> Optional[bytes]:
         """Generate speech using a trained voice model.
         
         Args:
             text: Text to synthesize
             model_path: Path to the trained voice model
             output_file: Optional path to save audio file
+            return_bytes: Whether to return the audio data; set False when
+                only ``output_file`` is wanted to skip the in-memory copy
             
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or None if return_bytes is False
         """
         pass
     
@@ -86,7 +156,6 @@ class BaseVoiceCloner(ABC):
         Returns:
             True if all files are valid
         """
-        import os
         for file_path in audio_files:
             if not os.path.exists(file_path):
                 logger.error(f"Audio file not found: {file_path}")
@@ -96,6 +165,17 @@ class BaseVoiceCloner(ABC):
                 return False
         return True
     
+    def get_model_metadata(self, model_path: str) -> Dict[str, Any]:
+        """Get extra profile metadata for a model created by train_voice.
+        
+        Args:
+            model_path: Path returned by train_voice
+            
+        Returns:
+            Dictionary merged into the voice profile metadata
+        """
+        return {}
+    
     def get_required_sample_duration(self) -> int:
         """Get recommended sample duration in seconds.
         
@@ -1,11 +1,15 @@
 """OpenVoice voice cloning implementation."""
 from typing import List, Optional
+import importlib.util
 import os
 import logging
-from .base import BaseVoiceCloner
+from .base import BaseVoiceCloner, ensure_dir, fast_copy
 
 logger = logging.getLogger(__name__)
 
+# Resolved once so load_model never pays for a failed import
+_OPENVOICE_AVAILABLE = importlib.util.find_spec("openvoice") is not None
+
 
 class OpenVoiceCloner(BaseVoiceCloner):
     """OpenVoice voice cloning implementation.
@@ -15,6 +19,8 @@ class OpenVoiceCloner(BaseVoiceCloner):
     Good for quick setup with tone/emotion control.
     """
     
+    __slots__ = ('model_name',)
+    
     def __init__(self, config):
         """Initialize OpenVoice cloner.
         
@@ -26,25 +32,20 @@ class OpenVoiceCloner(BaseVoiceCloner):
     
     def load_model(self) -> None:
         """Load the OpenVoice model."""
-        try:
-            # OpenVoice may have different import paths depending on version
-            # This is a placeholder for the actual implementation
-            logger.info(f"Loading OpenVoice model: {self.model_name}")
-            
-            # Mock implementation - replace with actual OpenVoice API when available
-            # from openvoice import se_extractor, OpenVoice
-            # self.se_extractor = se_extractor.get_se_extractor(device=self.device)
-            # self.model = OpenVoice(device=self.device)
-            
-            self.model = None  # Placeholder
-            logger.warning("OpenVoice implementation is a placeholder. Install openvoice library for full functionality.")
-            
-        except ImportError as e:
-            logger.error("openvoice library not installed. Install with: pip install openvoice")
-            raise ImportError("openvoice library required. Install with: pip install openvoice") from e
-        except Exception as e:
-            logger.error(f"Error loading OpenVoice model: {e}")
-            raise
+        # OpenVoice may have different import paths depending on version
+        # This is a placeholder for the actual implementation
+        logger.info(f"Loading OpenVoice model: {self.model_name}")
+        
+        if not _OPENVOICE_AVAILABLE:
+            logger.warning("openvoice library not installed. Install with: pip install openvoice")
+        
+        # Mock implementation - replace with actual OpenVoice API when available
+        # from openvoice.api import ToneColorConverter
+        # self.model = ToneColorConverter(config_path, device=self.device)
+        # self.model.load_ckpt(checkpoint_path)
+        
+        self.model = None  # Placeholder
+        logger.warning("OpenVoice implementation is a placeholder. Install openvoice library for full functionality.")
     
     def train_voice(
         self,
@@ -67,19 +68,19 @@ class OpenVoiceCloner(BaseVoiceCloner):
         if not self.validate_audio_files(audio_files):
             raise ValueError("Invalid audio files provided")
         
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
         # Placeholder implementation
         # In actual implementation, extract speaker embeddings
         embeddings_path = os.path.join(output_dir, f"{name}_embeddings.pt")
         
-        # Mock: Just copy the first audio file as reference
-        import shutil
+        # Placeholder: Just link or copy the first audio file as reference
         reference_path = os.path.join(output_dir, f"{name}_reference.wav")
-        shutil.copy(audio_files[0], reference_path)
+        fast_copy(audio_files[0], reference_path)
         
-        # In real implementation:
-        # se = self.se_extractor.get_se(audio_files[0])
+        # In real implementation, extract from all samples in one call; the
+        # converter averages the per-utterance embeddings:
+        # se = self.model.extract_se(audio_files)
         # torch.save(se, embeddings_path)
         
         logger.info(f"Created OpenVoice embeddings: {embeddings_path} (placeholder)")
@@ -89,17 +90,19 @@ class OpenVoiceCloner(BaseVoiceCloner):
         self,
         text: str,
         model_path: str,
-        output_file: Optional[str] = None
-    ) -> bytes:
+        output_file: Optional[str] = None,
+        return_bytes: bool = True
+    ) -> Optional[bytes]:
         """Generate speech using OpenVoice.
         
         Args:
             text: Text to synthesize
             model_path: Path to the embeddings file
             output_file: Optional path to save audio file
+            return_bytes: Whether to return the audio data
             
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or None if return_bytes is False
         """
         if self.model is None:
             self.load_model()
@@ -120,11 +123,13 @@ class OpenVoiceCloner(BaseVoiceCloner):
             buffer = io.BytesIO()
             
             if output_file:
-                os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+                ensure_dir(os.path.dirname(output_file) or '.')
                 with open(output_file, 'wb') as f:
                     f.write(buffer.getvalue())
                 logger.info(f"Saved audio to: {output_file}")
             
+            if not return_bytes:
+                return None
             return buffer.getvalue()
             
         except Exception as e:
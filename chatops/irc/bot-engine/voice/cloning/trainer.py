@@ -2,6 +2,20 @@
 from typing import List, Optional
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .base import require
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +23,13 @@ logger = logging.getLogger(__name__)
 class VoiceTrainer:
     """Utilities for training voice models."""
     
+    # Recording stops once this much trailing silence follows enough speech
+    SILENCE_THRESHOLD = 0.01
+    SILENCE_STOP_SECONDS = 1.0
+    MIN_SPEECH_SECONDS = 3.0
+    # Audio kept around the voiced region when trimming
+    TRIM_PADDING_SECONDS = 0.1
+    
     @staticmethod
     def record_samples(
         output_dir: str,
@@ -46,9 +67,9 @@ class VoiceTrainer:
         recorded_files = []
         
         try:
+            # sounddevice loads PortAudio on import, so it stays lazy
             import sounddevice as sd
-            import scipy.io.wavfile as wavfile
-            import numpy as np
+            require(sf, "soundfile")
             
             sample_rate = 22050
             
@@ -65,21 +86,16 @@ class VoiceTrainer:
                 print(f'  "{prompt}"\n')
                 
                 input("Press Enter to start recording...")
-                print(f"Recording for {duration} seconds...")
+                print(f"Recording for up to {duration} seconds (stops after a pause)...")
                 
-                # Record audio
-                recording = sd.rec(
-                    int(duration * sample_rate),
-                    samplerate=sample_rate,
-                    channels=1,
-                    dtype=np.float32
-                )
-                sd.wait()  # Wait until recording is finished
+                # Record audio and drop the silence around it
+                recording = VoiceTrainer._capture(sd, duration, sample_rate)
+                recording = VoiceTrainer._trim_silence(recording, sample_rate)
                 
                 # Save to file
                 filename = f"sample_{i:02d}.wav"
                 filepath = os.path.join(output_dir, filename)
-                wavfile.write(filepath, sample_rate, recording)
+                sf.write(filepath, recording, sample_rate)
                 recorded_files.append(filepath)
                 
                 print(f"✓ Saved: {filepath}")
@@ -93,11 +109,103 @@ class VoiceTrainer:
             
         except ImportError as e:
             logger.error("sounddevice library required for recording. Install with: pip install sounddevice")
-            raise ImportError("sounddevice required for recording. Install with: pip install sounddevice scipy") from e
+            raise ImportError("sounddevice required for recording. Install with: pip install sounddevice soundfile") from e
         except Exception as e:
             logger.error(f"Error during recording: {e}")
             raise
     
+    @staticmethod
+    def _capture(sd, duration: int, sample_rate: int):
+        """Capture one recording into a preallocated buffer.
+        
+        The input stream callback copies each block into the buffer, and the
+        caller sleeps on an event until the buffer is full or the speaker
+        has paused for SILENCE_STOP_SECONDS after at least
+        MIN_SPEECH_SECONDS of speech. Ctrl-C stops the recording early and
+        keeps what was captured, as does a device that stops delivering
+        audio before the duration plus a second has passed.
+        
+        Args:
+            sd: sounddevice module
+            duration: Maximum recording duration in seconds
+            sample_rate: Sample rate
+            
+        Returns:
+            Recorded float32 audio of shape (frames, 1)
+        """
+        total_frames = int(duration * sample_rate)
+        min_speech = int(VoiceTrainer.MIN_SPEECH_SECONDS * sample_rate)
+        stop_silence = int(VoiceTrainer.SILENCE_STOP_SECONDS * sample_rate)
+        threshold = VoiceTrainer.SILENCE_THRESHOLD
+        buffer = np.empty((total_frames, 1), dtype=np.float32)
+        write_idx = 0
+        speech_frames = 0
+        silence_frames = 0
+        done = threading.Event()
+        
+        def callback(indata, frames, time_info, status):
+            nonlocal write_idx, speech_frames, silence_frames
+            if status:
+                logger.warning(f"Recording status: {status}")
+            n = min(frames, total_frames - write_idx)
+            block = buffer[write_idx:write_idx + n]
+            block[:] = indata[:n]
+            write_idx += n
+            
+            # Block RMS decides speech vs. silence
+            if n and np.sqrt(np.mean(np.square(block))) >= threshold:
+                speech_frames += n
+                silence_frames = 0
+            else:
+                silence_frames += n
+            
+            if write_idx >= total_frames or (
+                speech_frames >= min_speech and silence_frames >= stop_silence
+            ):
+                done.set()
+                raise sd.CallbackStop
+        
+        with sd.InputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype='float32',
+            blocksize=1024,
+            latency='low',
+            callback=callback
+        ):
+            try:
+                # A stalled device never fires the callback again, so do
+                # not wait past the requested duration plus some slack
+                if not done.wait(duration + 1.0):
+                    logger.warning(
+                        f"Recording timed out after {duration + 1.0:.1f}s; "
+                        "keeping what was captured"
+                    )
+            except KeyboardInterrupt:
+                print("Recording stopped early.")
+        
+        return buffer[:write_idx]
+    
+    @staticmethod
+    def _trim_silence(audio, sample_rate: int):
+        """Strip leading and trailing silence from a recording.
+        
+        Args:
+            audio: Recorded float32 audio of shape (frames, 1)
+            sample_rate: Sample rate
+            
+        Returns:
+            Trimmed view of the audio, or the input if it is all silence
+        """
+        voiced = np.abs(audio[:, 0]) > VoiceTrainer.SILENCE_THRESHOLD
+        if not voiced.any():
+            return audio
+        
+        pad = int(VoiceTrainer.TRIM_PADDING_SECONDS * sample_rate)
+        start = max(int(np.argmax(voiced)) - pad, 0)
+        end = min(len(voiced) - int(np.argmax(voiced[::-1])) + pad, len(voiced))
+        return audio[start:end]
+    
     @staticmethod
     def validate_samples(audio_files: List[str], min_duration: int = 5) -> bool:
         """Validate recorded audio samples.
@@ -109,23 +217,32 @@ class VoiceTrainer:
         Returns:
             True if all samples are valid
         """
+        if not audio_files:
+            return True
+        
         try:
-            import scipy.io.wavfile as wavfile
+            require(sf, "soundfile")
             
             for filepath in audio_files:
                 if not os.path.exists(filepath):
                     logger.error(f"File not found: {filepath}")
                     return False
-                
-                # Read audio file
-                sample_rate, audio_data = wavfile.read(filepath)
-                duration = len(audio_data) / sample_rate
-                
-                if duration < min_duration:
-                    logger.error(f"Sample too short: {filepath} ({duration:.1f}s < {min_duration}s)")
-                    return False
-                
-                logger.info(f"Valid sample: {filepath} ({duration:.1f}s)")
+            
+            # Only the headers are needed for duration, so read them in parallel
+            with ThreadPoolExecutor(max_workers=min(8, len(audio_files))) as pool:
+                futures = {pool.submit(sf.info, filepath): filepath for filepath in audio_files}
+                for future in as_completed(futures):
+                    filepath = futures[future]
+                    info = future.result()
+                    duration = info.frames / info.samplerate if info.samplerate else 0.0
+                    
+                    if info.frames == 0 or duration < min_duration:
+                        logger.error(f"Sample too short: {filepath} ({duration:.1f}s < {min_duration}s)")
+                        for pending in futures:
+                            pending.cancel()
+                        return False
+                    
+                    logger.info(f"Valid sample: {filepath} ({duration:.1f}s)")
             
             return True
             
@@ -152,15 +269,21 @@ class VoiceTrainer:
             Path to preprocessed audio file
         """
         try:
-            import librosa
-            import soundfile as sf
+            require(sf, "soundfile")
             
-            # Load audio
-            audio, sr = librosa.load(input_file, sr=target_sample_rate)
+            # Load audio, downmixing to mono
+            audio, sr = sf.read(input_file, dtype='float32', always_2d=False)
+            if audio.ndim == 2:
+                audio = audio.mean(axis=1)
             
-            # Normalize if requested
+            if sr != target_sample_rate:
+                audio = VoiceTrainer._resample(audio, sr, target_sample_rate)
+            
+            # Peak-normalize in place if requested (skip silent clips)
             if normalize:
-                audio = librosa.util.normalize(audio)
+                peak = np.abs(audio).max()
+                if peak > 1e-8:
+                    np.multiply(audio, 1.0 / peak, out=audio)
             
             # Save preprocessed audio
             os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
@@ -170,8 +293,30 @@ class VoiceTrainer:
             return output_file
             
         except ImportError as e:
-            logger.error("librosa library required. Install with: pip install librosa soundfile")
-            raise ImportError("librosa required for preprocessing. Install with: pip install librosa soundfile") from e
+            logger.error("soundfile library required. Install with: pip install soundfile torchaudio")
+            raise ImportError("soundfile required for preprocessing. Install with: pip install soundfile torchaudio") from e
         except Exception as e:
             logger.error(f"Error preprocessing audio: {e}")
             raise
+    
+    @staticmethod
+    def _resample(audio, orig_sample_rate: int, target_sample_rate: int):
+        """Resample mono float32 audio.
+        
+        Uses torchaudio's resampler when available, falling back to resampy.
+        
+        Args:
+            audio: Mono float32 audio samples
+            orig_sample_rate: Sample rate of the input
+            target_sample_rate: Desired sample rate
+            
+        Returns:
+            Resampled float32 audio samples
+        """
+        try:
+            import torch
+            import torchaudio.functional as AF
+            return AF.resample(torch.from_numpy(audio), orig_sample_rate, target_sample_rate).numpy()
+        except ImportError:
+            import resampy
+            return resampy.resample(audio, orig_sample_rate, target_sample_rate, filter='kaiser_fast')
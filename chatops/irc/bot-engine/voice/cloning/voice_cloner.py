@@ -1,10 +1,11 @@
 """Master voice cloning system."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 import os
 import logging
 
 from ..base import VoiceCloningConfig
+from .base import BaseVoiceCloner
 from .voice_profile import VoiceProfile, VoiceProfileManager
 from .xtts_cloner import XTTSCloner
 from .tortoise_cloner import TortoiseCloner
@@ -18,9 +19,16 @@ class VoiceCloner:
     """Master voice cloning system.
     
     Orchestrates multiple voice cloning engines (XTTS, Tortoise, OpenVoice)
-    and manages voice profiles.
+    and manages voice profiles. Engine cloners are constructed on first use,
+    so only the engines actually needed pay their setup cost.
     """
     
+    _engine_classes = {
+        "xtts": XTTSCloner,
+        "tortoise": TortoiseCloner,
+        "openvoice": OpenVoiceCloner,
+    }
+    
     def __init__(self, config: VoiceCloningConfig):
         """Initialize the voice cloner.
         
@@ -31,16 +39,15 @@ class VoiceCloner:
         self.profiles = VoiceProfileManager(config.profiles_dir)
         self.master_voice: Optional[VoiceProfile] = None
         
-        # Initialize cloning engines
-        self.xtts = XTTSCloner(config)
-        self.tortoise = TortoiseCloner(config)
-        self.openvoice = OpenVoiceCloner(config)
+        # Cloning engines, created on first use by _get_cloner
+        self._cloners: Dict[str, BaseVoiceCloner] = {}
         
-        # Load master voice if configured
+        # Load master voice if configured, warming up only its engine
         if config.master_voice_name:
             try:
                 self.master_voice = self.profiles.get_profile(config.master_voice_name)
                 if self.master_voice:
+                    self._get_cloner(self.master_voice.engine)
                     logger.info(f"Loaded master voice: {config.master_voice_name}")
             except Exception as e:
                 logger.warning(f"Could not load master voice: {e}")
@@ -55,15 +62,34 @@ class VoiceCloner:
             
         Returns:
             Cloner instance
+            
+        Raises:
+            ValueError: If the engine is unknown
         """
-        if engine == "xtts":
-            return self.xtts
-        elif engine == "tortoise":
-            return self.tortoise
-        elif engine == "openvoice":
-            return self.openvoice
-        else:
-            raise ValueError(f"Unknown engine: {engine}")
+        cloner = self._cloners.get(engine)
+        if cloner is None:
+            try:
+                cloner_class = self._engine_classes[engine]
+            except KeyError:
+                raise ValueError(f"Unknown engine: {engine}") from None
+            cloner = cloner_class(self.config)
+            self._cloners[engine] = cloner
+        return cloner
+    
+    @property
+    def xtts(self) -> XTTSCloner:
+        """XTTS cloner, created on first access."""
+        return self._get_cloner("xtts")
+    
+    @property
+    def tortoise(self) -> TortoiseCloner:
+        """Tortoise cloner, created on first access."""
+        return self._get_cloner("tortoise")
+    
+    @property
+    def openvoice(self) -> OpenVoiceCloner:
+        """OpenVoice cloner, created on first access."""
+        return self._get_cloner("openvoice")
     
     def create_master_voice(
         self,
@@ -105,15 +131,21 @@ class VoiceCloner:
         else:
             raise ValueError(f"Profile not found: {profile_name}")
     
-    def speak_as_master(self, text: str, output_file: Optional[str] = None) -> bytes:
+    def speak_as_master(
+        self,
+        text: str,
+        output_file: Optional[str] = None,
+        return_bytes: bool = True
+    ) -> Optional[bytes]:
         """Speak using the master voice persona.
         
         Args:
             text: Text to synthesize
             output_file: Optional path to save audio
+            return_bytes: Whether to return the audio data
             
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or None if return_bytes is False
         """
         if self.master_voice is None:
             master = self.profiles.get_master_voice()
@@ -121,7 +153,9 @@ class VoiceCloner:
                 raise ValueError("No master voice configured")
             self.master_voice = master
         
-        return self._synthesize_with_profile(self.master_voice, text, output_file)
+        return self._synthesize_with_profile(
+            self.master_voice, text, output_file, return_bytes
+        )
     
     def clone_voice(
         self,
@@ -165,7 +199,8 @@ class VoiceCloner:
             is_master=False,
             metadata={
                 "num_samples": len(audio_files),
-                "cloner_class": cloner.__class__.__name__
+                "cloner_class": cloner.__class__.__name__,
+                **cloner.get_model_metadata(model_path)
             }
         )
         
@@ -207,20 +242,24 @@ class VoiceCloner:
         self,
         profile: VoiceProfile,
         text: str,
-        output_file: Optional[str] = None
-    ) -> bytes:
+        output_file: Optional[str] = None,
+        return_bytes: bool = True
+    ) -> Optional[bytes]:
         """Synthesize speech using a voice profile.
         
         Args:
             profile: VoiceProfile to use
             text: Text to synthesize
             output_file: Optional path to save audio
+            return_bytes: Whether to return the audio data
             
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or None if return_bytes is False
         """
         cloner = self._get_cloner(profile.engine)
-        return cloner.synthesize_speech(text, profile.model_path, output_file)
+        return cloner.synthesize_speech(
+            text, profile.model_path, output_file, return_bytes
+        )
     
     def delete_profile(self, name: str) -> bool:
         """Delete a voice profile.
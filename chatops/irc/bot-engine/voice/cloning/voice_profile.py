@@ -1,15 +1,36 @@
 """Voice profile management for cloned voices."""
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
 import os
 import logging
+import tempfile
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse profile JSON, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize profile JSON, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+@dataclass(slots=True)
 class VoiceProfile:
     """A cloned voice profile."""
     name: str
@@ -23,12 +44,21 @@ class VoiceProfile:
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary for serialization.
         
+        The list and dict fields are shared rather than deep-copied; the
+        result is meant to be serialized straight away.
+        
         Returns:
             Dictionary representation of the profile
         """
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        return data
+        return {
+            'name': self.name,
+            'engine': self.engine,
+            'created_at': self.created_at.isoformat(),
+            'sample_files': self.sample_files,
+            'model_path': self.model_path,
+            'is_master': self.is_master,
+            'metadata': self.metadata,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'VoiceProfile':
@@ -53,8 +83,24 @@ class VoiceProfile:
         os.makedirs(profiles_dir, exist_ok=True)
         profile_file = os.path.join(profiles_dir, f"{self.name}.json")
         
-        with open(profile_file, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Write to a temp file and rename it over the profile so concurrent
+        # readers only ever see a complete file. The name is unique per save,
+        # so two saves of one profile never share a temp file, and the data
+        # is synced first so a crash cannot leave a partial file behind
+        fd, tmp_file = tempfile.mkstemp(prefix=f".{self.name}.", suffix='.tmp', dir=profiles_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                os.fchmod(f.fileno(), 0o644)
+                f.write(_dumps(self.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, profile_file)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
         
         logger.info(f"Saved voice profile: {profile_file}")
     
@@ -74,8 +120,8 @@ class VoiceProfile:
         if not os.path.exists(profile_file):
             raise FileNotFoundError(f"Profile not found: {profile_file}")
         
-        with open(profile_file, 'r') as f:
-            data = json.load(f)
+        with open(profile_file, 'rb') as f:
+            data = _loads(f.read())
         
         logger.info(f"Loaded voice profile: {profile_file}")
         return cls.from_dict(data)
@@ -95,7 +141,13 @@ class VoiceProfile:
 
 
 class VoiceProfileManager:
-    """Manages voice profiles."""
+    """Manages voice profiles.
+    
+    Parsed profiles are cached per name and keyed on the file's mtime and
+    size, so repeated listings only re-read files that changed on disk.
+    Callers always get copies, so changing a returned profile never
+    touches the cache until it has been saved.
+    """
     
     def __init__(self, profiles_dir: str):
         """Initialize profile manager.
@@ -104,9 +156,62 @@ class VoiceProfileManager:
             profiles_dir: Directory for storing profiles
         """
         self.profiles_dir = profiles_dir
+        self._cache: Dict[str, Tuple[Tuple[int, int], VoiceProfile]] = {}
         os.makedirs(profiles_dir, exist_ok=True)
         logger.info(f"Voice profile manager initialized: {profiles_dir}")
     
+    @staticmethod
+    def _copy(profile: VoiceProfile) -> VoiceProfile:
+        """Copy a profile, including its sample list and metadata.
+        
+        Args:
+            profile: Profile to copy
+            
+        Returns:
+            Independent VoiceProfile instance
+        """
+        return replace(
+            profile,
+            sample_files=list(profile.sample_files),
+            metadata=dict(profile.metadata)
+        )
+    
+    def _load_cached(self, name: str, path: str, st: os.stat_result) -> VoiceProfile:
+        """Return a copy of a cached profile, re-reading it only if the file changed.
+        
+        Args:
+            name: Profile name
+            path: Path to the profile JSON file
+            st: stat result for the file
+            
+        Returns:
+            VoiceProfile instance
+        """
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == stamp:
+            return self._copy(cached[1])
+        
+        with open(path, 'rb') as f:
+            profile = VoiceProfile.from_dict(_loads(f.read()))
+        
+        logger.debug(f"Loaded voice profile: {path}")
+        self._cache[name] = (stamp, self._copy(profile))
+        return profile
+    
+    def _save(self, profile: VoiceProfile) -> None:
+        """Save a profile and refresh its cache entry.
+        
+        The cache only changes once the file has been replaced on disk.
+        
+        Args:
+            profile: Profile to save
+        """
+        profile.save(self.profiles_dir)
+        path = os.path.join(self.profiles_dir, f"{profile.name}.json")
+        st = os.stat(path)
+        self._cache[profile.name] = ((st.st_mtime_ns, st.st_size), self._copy(profile))
+    
     def list_profiles(self) -> List[VoiceProfile]:
         """List all saved voice profiles.
         
@@ -114,19 +219,29 @@ class VoiceProfileManager:
             List of VoiceProfile instances
         """
         profiles = []
+        seen = set()
         
-        if not os.path.exists(self.profiles_dir):
+        try:
+            it = os.scandir(self.profiles_dir)
+        except FileNotFoundError:
+            self._cache.clear()
             return profiles
         
-        for filename in os.listdir(self.profiles_dir):
-            if filename.endswith('.json'):
-                profile_name = filename[:-5]  # Remove .json
+        with it:
+            for entry in it:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                profile_name = entry.name[:-5]  # Remove .json
                 try:
-                    profile = VoiceProfile.load(profile_name, self.profiles_dir)
-                    profiles.append(profile)
+                    profiles.append(self._load_cached(profile_name, entry.path, entry.stat()))
+                    seen.add(profile_name)
                 except Exception as e:
                     logger.error(f"Error loading profile {profile_name}: {e}")
         
+        # Drop entries for profiles removed behind our back
+        for name in self._cache.keys() - seen:
+            del self._cache[name]
+        
         return profiles
     
     def get_profile(self, name: str) -> Optional[VoiceProfile]:
@@ -138,9 +253,11 @@ class VoiceProfileManager:
         Returns:
             VoiceProfile or None if not found
         """
+        profile_file = os.path.join(self.profiles_dir, f"{name}.json")
         try:
-            return VoiceProfile.load(name, self.profiles_dir)
+            return self._load_cached(name, profile_file, os.stat(profile_file))
         except FileNotFoundError:
+            self._cache.pop(name, None)
             return None
     
     def delete_profile(self, name: str) -> bool:
@@ -153,6 +270,7 @@ class VoiceProfileManager:
             True if deleted successfully
         """
         profile_file = os.path.join(self.profiles_dir, f"{name}.json")
+        self._cache.pop(name, None)
         
         if os.path.exists(profile_file):
             os.remove(profile_file)
@@ -175,24 +293,59 @@ class VoiceProfileManager:
     def set_master_voice(self, name: str) -> bool:
         """Set a profile as the master voice.
         
+        Only the profiles whose flag actually changes are written back, and
+        nothing is written if the profile does not exist.
+        
         Args:
             name: Profile name
             
         Returns:
             True if set successfully
         """
-        # Unset any existing master voice
+        target = None
+        previous = []
         for profile in self.list_profiles():
-            if profile.is_master:
+            if profile.name == name:
+                target = profile
+            elif profile.is_master:
+                previous.append(profile)
+        
+        if target is None:
+            return False
+        
+        changed = False
+        try:
+            # Unset the existing master voice
+            for profile in previous:
                 profile.is_master = False
-                profile.save(self.profiles_dir)
-        
-        # Set the new master voice
-        profile = self.get_profile(name)
-        if profile:
-            profile.is_master = True
-            profile.save(self.profiles_dir)
-            logger.info(f"Set master voice: {name}")
-            return True
+                self._save(profile)
+                changed = True
+            
+            # Set the new master voice
+            if not target.is_master:
+                target.is_master = True
+                self._save(target)
+                changed = True
+        finally:
+            if changed:
+                self._fsync_dir()
         
-        return False
+        logger.info(f"Set master voice: {name}")
+        return True
+    
+    def _fsync_dir(self) -> None:
+        """Flush the profiles directory entry to disk.
+        
+        VoiceProfile.save syncs each file's contents before renaming it;
+        this makes the renames themselves durable, once per batch of saves.
+        """
+        try:
+            fd = os.open(self.profiles_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -1,11 +1,32 @@
 """XTTS/Coqui TTS voice cloning implementation."""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import importlib.util
+import io
 import os
 import logging
-from .base import BaseVoiceCloner
+import tempfile
+from .base import BaseVoiceCloner, ensure_dir, fast_copy, require
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+try:
+    import scipy.io.wavfile as wavfile
+except ImportError:
+    wavfile = None
 
 logger = logging.getLogger(__name__)
 
+# Resolved once so load_model never pays for a failed import
+_TTS_AVAILABLE = importlib.util.find_spec("TTS") is not None
+
 
 class XTTSCloner(BaseVoiceCloner):
     """XTTS/Coqui TTS voice cloning implementation.
@@ -14,6 +35,10 @@ class XTTSCloner(BaseVoiceCloner):
     Requires only 6-10 seconds of voice samples.
     """
     
+    SPEAKER_SAMPLE_RATE = 22050
+    MAX_SPEAKER_SECONDS = 60
+    LATENTS_SUFFIX = ".pt"
+    
     def __init__(self, config):
         """Initialize XTTS cloner.
         
@@ -22,17 +47,22 @@ class XTTSCloner(BaseVoiceCloner):
         """
         super().__init__(config)
         self.model_name = config.xtts_model
+        # Speaker wav path -> (wav mtime_ns, (gpt_cond_latent, speaker_embedding))
+        self._latents_cache: Dict[str, Tuple[int, Any]] = {}
+        # Speaker wav path -> sample it was linked from
+        self._speaker_sources: Dict[str, str] = {}
     
     def load_model(self) -> None:
         """Load the XTTS model."""
+        if not _TTS_AVAILABLE:
+            logger.error("TTS library not installed. Install with: pip install TTS")
+            raise ImportError("TTS library required for XTTS. Install with: pip install TTS")
+        
         try:
             from TTS.api import TTS
             logger.info(f"Loading XTTS model: {self.model_name}")
             self.model = TTS(self.model_name).to(self.device)
             logger.info("XTTS model loaded successfully")
-        except ImportError as e:
-            logger.error("TTS library not installed. Install with: pip install TTS")
-            raise ImportError("TTS library required for XTTS. Install with: pip install TTS") from e
         except Exception as e:
             logger.error(f"Error loading XTTS model: {e}")
             raise
@@ -58,70 +88,259 @@ class XTTSCloner(BaseVoiceCloner):
         if not self.validate_audio_files(audio_files):
             raise ValueError("Invalid audio files provided")
         
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # XTTS uses the first audio file as the speaker reference
-        # In practice, you might want to concatenate or use the best quality sample
-        speaker_wav = audio_files[0]
+        ensure_dir(output_dir)
         
-        # Copy the speaker wav to the output directory
-        import shutil
+        # XTTS takes a single speaker reference, so merge all samples into
+        # one; a lone sample already in the target format is linked as is
         model_path = os.path.join(output_dir, f"{name}_speaker.wav")
-        shutil.copy(speaker_wav, model_path)
+        source = self._clean_speaker_source(audio_files)
+        if source is not None:
+            fast_copy(source, model_path)
+            self._speaker_sources[model_path] = os.path.abspath(source)
+        else:
+            self._merge_speaker_samples(audio_files, model_path)
+            self._speaker_sources.pop(model_path, None)
+        
+        # Precompute the speaker latents so synthesis can skip the encoder
+        try:
+            if self.model is None:
+                self.load_model()
+            import torch
+            latents = self._compute_conditioning_latents(model_path)
+            if latents is not None:
+                torch.save(
+                    {'gpt': latents[0], 'spk': latents[1]},
+                    model_path + self.LATENTS_SUFFIX
+                )
+                self._latents_cache[model_path] = (os.stat(model_path).st_mtime_ns, latents)
+        except Exception as e:
+            # Best effort: the voice is usable without the saved latents
+            logger.warning(f"Skipping speaker latent precompute ({e}); they will be computed at synthesis time")
         
         logger.info(f"Created XTTS voice model: {model_path}")
         return model_path
     
+    def _clean_speaker_source(self, audio_files: List[str]) -> Optional[str]:
+        """Return the sample to link if it can be used as the reference as is.
+        
+        Args:
+            audio_files: List of audio file paths
+            
+        Returns:
+            The single sample path if it is a mono 16-bit WAV at
+            SPEAKER_SAMPLE_RATE within MAX_SPEAKER_SECONDS, otherwise None
+        """
+        if len(audio_files) != 1 or sf is None:
+            return None
+        
+        try:
+            info = sf.info(audio_files[0])
+        except RuntimeError:
+            return None
+        
+        if (info.format == 'WAV' and info.subtype == 'PCM_16'
+                and info.channels == 1
+                and info.samplerate == self.SPEAKER_SAMPLE_RATE
+                and info.duration <= self.MAX_SPEAKER_SECONDS):
+            return audio_files[0]
+        return None
+    
+    def _merge_speaker_samples(self, audio_files: List[str], output_file: str) -> None:
+        """Concatenate samples into one peak-normalized speaker reference.
+        
+        Samples are downmixed to mono, resampled to SPEAKER_SAMPLE_RATE and
+        truncated once MAX_SPEAKER_SECONDS of audio has been collected.
+        
+        Args:
+            audio_files: List of audio file paths
+            output_file: Path for the merged 16-bit WAV (replaced if it exists)
+        """
+        require(sf, "soundfile")
+        from .trainer import VoiceTrainer
+        
+        rate = self.SPEAKER_SAMPLE_RATE
+        # Each sample is copied straight into its slot, so only one decoded
+        # file is alive next to the output at a time
+        merged = np.empty(self.MAX_SPEAKER_SECONDS * rate, dtype=np.float32)
+        filled = 0
+        
+        for audio_file in audio_files:
+            audio, sr = sf.read(audio_file, dtype='float32', always_2d=False)
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1)
+            if sr != rate:
+                audio = VoiceTrainer._resample(audio, sr, rate)
+            
+            n = min(len(audio), len(merged) - filled)
+            merged[filled:filled + n] = audio[:n]
+            filled += n
+            del audio
+            if filled == len(merged):
+                break
+        
+        merged = merged[:filled]
+        peak = np.abs(merged).max()
+        if peak > 1e-8:
+            np.multiply(merged, 1.0 / peak, out=merged)
+        
+        # The previous reference may be a hardlink to the user's own
+        # recording, so write a new file and swap it in rather than
+        # overwriting that inode
+        fd, tmp_file = tempfile.mkstemp(
+            suffix='.wav', dir=os.path.dirname(output_file) or '.'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                sf.write(f, merged, rate, format='WAV', subtype='PCM_16')
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+    
     def synthesize_speech(
         self,
         text: str,
         model_path: str,
-        output_file: Optional[str] = None
-    ) -> bytes:
+        output_file: Optional[str] = None,
+        return_bytes: bool = True
+    ) -> Optional[bytes]:
         """Generate speech using XTTS.
         
         Args:
             text: Text to synthesize
             model_path: Path to the speaker wav file
             output_file: Optional path to save audio file
+            return_bytes: Whether to return the audio data
             
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or None if return_bytes is False
         """
         if self.model is None:
             self.load_model()
         
-        if not os.path.exists(model_path):
+        try:
+            mtime_ns = os.stat(model_path).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Speaker wav not found: {model_path}")
         
         try:
-            # Generate speech using the speaker wav
-            wav = self.model.tts(
-                text=text,
-                speaker_wav=model_path,
-                language="en"
-            )
+            latents = self._get_conditioning_latents(model_path, mtime_ns)
+            if latents is not None:
+                # Decoder-only path with the cached speaker latents
+                gpt_cond_latent, speaker_embedding = latents
+                out = self.model.synthesizer.tts_model.inference(
+                    text=text,
+                    language="en",
+                    gpt_cond_latent=gpt_cond_latent,
+                    speaker_embedding=speaker_embedding
+                )
+                wav = out["wav"]
+                if hasattr(wav, "cpu"):
+                    wav = wav.cpu().numpy()
+            else:
+                # Generate speech using the speaker wav
+                wav = self.model.tts(
+                    text=text,
+                    speaker_wav=model_path,
+                    language="en"
+                )
+            
+            require(wavfile, "scipy")
+            
+            # Encode once as 16-bit PCM; half the size of float32 WAV and
+            # the format AudioPlayer decodes to anyway
+            pcm = np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0)
+            pcm *= 32767.0
+            buffer = io.BytesIO()
+            wavfile.write(buffer, 22050, pcm.astype(np.int16))
+            data = buffer.getvalue()
             
             # Save to file if requested
             if output_file:
-                import scipy.io.wavfile as wavfile
-                import numpy as np
-                os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
-                wavfile.write(output_file, 22050, np.array(wav, dtype=np.float32))
+                ensure_dir(os.path.dirname(output_file) or '.')
+                with open(output_file, 'wb') as f:
+                    f.write(data)
                 logger.info(f"Saved audio to: {output_file}")
+                
+                if not return_bytes:
+                    return None
             
-            # Convert to bytes
-            import io
-            import scipy.io.wavfile as wavfile
-            import numpy as np
-            buffer = io.BytesIO()
-            wavfile.write(buffer, 22050, np.array(wav, dtype=np.float32))
-            return buffer.getvalue()
+            return data
             
         except Exception as e:
             logger.error(f"Error synthesizing speech with XTTS: {e}")
             raise
     
+    def _get_conditioning_latents(self, model_path: str, mtime_ns: int):
+        """Get the speaker latents for a speaker wav.
+        
+        Latents are loaded from the file saved by ``train_voice`` when it is
+        newer than the wav, otherwise computed from the wav. Either way they
+        are kept in memory until the wav changes.
+        
+        Args:
+            model_path: Path to the speaker wav file
+            mtime_ns: Speaker wav modification time
+            
+        Returns:
+            Tuple of (gpt_cond_latent, speaker_embedding), or None if the
+            loaded model does not expose XTTS conditioning latents
+        """
+        cached = self._latents_cache.get(model_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        latents_file = model_path + self.LATENTS_SUFFIX
+        try:
+            fresh = os.stat(latents_file).st_mtime_ns >= mtime_ns
+        except FileNotFoundError:
+            fresh = False
+        
+        if fresh:
+            import torch
+            saved = torch.load(latents_file, map_location=self.device)
+            latents = (saved['gpt'], saved['spk'])
+            logger.info(f"Loaded XTTS speaker latents: {latents_file}")
+        else:
+            latents = self._compute_conditioning_latents(model_path)
+            if latents is None:
+                return None
+            logger.info(f"Computed XTTS speaker latents: {model_path}")
+        
+        self._latents_cache[model_path] = (mtime_ns, latents)
+        return latents
+    
+    def _compute_conditioning_latents(self, model_path: str):
+        """Run the XTTS speaker encoder over a speaker wav.
+        
+        Args:
+            model_path: Path to the speaker wav file
+            
+        Returns:
+            Tuple of (gpt_cond_latent, speaker_embedding), or None if the
+            loaded model is not an XTTS model
+        """
+        tts_model = getattr(getattr(self.model, "synthesizer", None), "tts_model", None)
+        if not hasattr(tts_model, "get_conditioning_latents"):
+            return None
+        
+        return tts_model.get_conditioning_latents(audio_path=[model_path])
+    
+    def get_model_metadata(self, model_path: str) -> Dict[str, Any]:
+        """Record the sample a linked speaker wav came from.
+        
+        Args:
+            model_path: Path to the speaker wav file
+            
+        Returns:
+            Dictionary with ``speaker_source`` if the wav was linked
+        """
+        source = self._speaker_sources.get(model_path)
+        return {"speaker_source": source} if source else {}
+    
     def get_required_sample_duration(self) -> int:
         """Get recommended sample duration for XTTS.
         
@@ -1,28 +1,77 @@
-"""Audio playback module."""
+"""Audio playback using sounddevice."""
 
+import contextlib
+import hashlib
+import io
 import logging
-from typing import Optional
-import threading
-"""Audio playback using pygame."""
-import logging
+import mmap
+import os
 import threading
-from pathlib import Path
+import wave
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
-import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+from .wavfile import find_pcm_data
 
 logger = logging.getLogger(__name__)
 
 
 class AudioPlayer:
-    """Play audio through speakers."""
+    """Play audio through speakers.
     
-    """Audio player using pygame for playing audio files."""
+    Clips are decoded to int16 and written to one persistent sounddevice
+    output stream, which is reopened only when the sample rate or channel
+    count changes.
+    """
+
+    # Frames per PortAudio period; playback is written in multiples of this
+    BLOCKSIZE = 1024
+    WRITE_BLOCKS = 8
+    # Decoded clips kept for replays (notification sounds, repeated prompts)
+    _CACHE_MAX = 32
+    # WAVs smaller than this are read into memory instead of mapped; a
+    # mapped file that is truncated while in use faults with SIGBUS
+    _MAP_MIN_BYTES = 4 * 1024 * 1024
 
     def __init__(self, config):
         """Initialize audio player."""
         self.config = config
         self._playing = False
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._volume = getattr(config, 'volume', 1.0)
+        self._stream = None
+        self._cache = OrderedDict()
+        # The playback lock backs a condition shared with the writer threads,
+        # but the decode cache only needs one when play() runs concurrently
+        if getattr(config, 'thread_safe', True):
+            self._cache_lock = threading.Lock()
+        else:
+            self._cache_lock = contextlib.nullcontext()
+        # Clips decoded by preload(), held so they outlive cache eviction
+        self._preloaded = []
+        # Shared workers for play_async() instead of a thread per clip
+        self._pool = ThreadPoolExecutor(
+            max_workers=getattr(config, 'audio_pool_size', 2),
+            thread_name_prefix='audio'
+        )
+        # Non-blocking writes get their own thread: play_async() workers can
+        # wait for _playing to clear, and only a write can clear it
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='audio-writer')
         self._initialize()
     
     def _initialize(self):
@@ -34,177 +83,295 @@ class AudioPlayer:
         except ImportError:
             logger.warning("sounddevice not installed, audio playback will not work")
             self.sd = None
+            return
+        
+        # Open the output stream up front so the first play skips device setup
+        try:
+            self._open_stream(getattr(self.config, 'sample_rate', 22050), 1)
+        except Exception as e:
+            logger.warning(f"Could not open audio output stream yet: {e}")
+        
+        preload_files = getattr(self.config, 'preload_files', None)
+        if preload_files:
+            self.preload(preload_files)
+    
+    def _open_stream(self, sample_rate: int, channels: int):
+        """
+        (Re)open the persistent output stream.
+        
+        Args:
+            sample_rate: Stream sample rate
+            channels: Number of output channels
+        """
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        
+        self._stream = self.sd.OutputStream(
+            samplerate=sample_rate,
+            channels=channels,
+            dtype='int16',
+            blocksize=self.BLOCKSIZE,
+            latency='low'
+        )
+        self._stream.start()
+    
+    def _write(self, audio_array):
+        """
+        Write audio to the output stream until done or stopped.
+        
+        Args:
+            audio_array: int16 audio shaped for the stream
+        """
+        step = self.BLOCKSIZE * self.WRITE_BLOCKS
+        try:
+            for start in range(0, len(audio_array), step):
+                self._resume_event.wait()
+                if self._stop_event.is_set():
+                    break
+                
+                chunk = audio_array[start:start + step]
+                volume = self._volume
+                if volume != 1.0:
+                    chunk = (chunk * volume).astype(chunk.dtype)
+                self._stream.write(chunk)
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.error(f"Audio playback failed: {e}")
+        finally:
+            with self._cond:
+                self._playing = False
+                self._cond.notify_all()
     
-    def play(self, audio_data: bytes, blocking: bool = True) -> bool:
+    def play(self, audio_data, blocking: bool = False) -> bool:
         """
-        Play audio data.
+        Play audio data or an audio file.
         
         Args:
-            audio_data: Audio bytes (WAV format)
+            audio_data: Audio bytes (WAV format) or path to an audio file
             blocking: Wait for playback to complete
             
         Returns:
-            True if successful
+            True if playback started successfully, False otherwise
         """
         if not self.sd:
             logger.error("Audio player not initialized")
             return False
         
-        if isinstance(audio_data, str):
-            # If it's a file path, read the file
-            try:
-                with open(audio_data, 'rb') as f:
-                    audio_data = f.read()
-            except Exception as e:
-                logger.error(f"Failed to read audio file: {e}")
-                return False
+        supported = getattr(self.config, 'supported_formats', None)
+        if supported and isinstance(audio_data, str):
+            file_ext = os.path.splitext(audio_data)[1][1:].lower()
+            if file_ext not in supported:
+                logger.warning(f"Unsupported audio format: {file_ext}")
+                # Try to play anyway
         
         try:
-            import wave
-            import io
-            import numpy as np
+            audio_array, sample_rate = self._load(audio_data)
+        except Exception as e:
+            logger.error(f"Failed to decode audio: {e}")
+            return False
+        
+        try:
+            channels = 1 if audio_array.ndim == 1 else audio_array.shape[1]
             
-            # Parse WAV data
-            buffer = io.BytesIO(audio_data)
-            with wave.open(buffer, 'rb') as wf:
-                sample_rate = wf.getframerate()
-                channels = wf.getnchannels()
-                frames = wf.readframes(wf.getnframes())
-                audio_array = np.frombuffer(frames, dtype=np.int16)
+            with self._cond:
+                # New audio replaces whatever is playing
+                if self._playing:
+                    self._stop_event.set()
+                    self._resume_event.set()
+                    self._cond.wait_for(lambda: not self._playing)
+                self._stop_event.clear()
+                self._resume_event.set()
+                
+                stream = self._stream
+                if (stream is None or stream.samplerate != sample_rate
+                        or stream.channels != channels):
+                    self._open_stream(sample_rate, channels)
                 
-                if channels > 1:
-                    audio_array = audio_array.reshape(-1, channels)
-            
-            with self._lock:
                 self._playing = True
             
             # Play audio
-            self.sd.play(audio_array, sample_rate, blocking=blocking)
-            
             if blocking:
-                self.sd.wait()
-                with self._lock:
-                    self._playing = False
+                self._write(audio_array)
             else:
-                # Set flag to False after playback in separate thread
-                def reset_flag():
-                    self.sd.wait()
-                    with self._lock:
-                        self._playing = False
-                
-                thread = threading.Thread(target=reset_flag, daemon=True)
-                thread.start()
+                self._writer.submit(self._write, audio_array)
             
             return True
         except Exception as e:
             logger.error(f"Audio playback failed: {e}")
-            with self._lock:
+            with self._cond:
                 self._playing = False
+                self._cond.notify_all()
             return False
     
-    def stop(self):
-        """Stop current playback."""
-        if self.sd:
-            try:
-                self.sd.stop()
-                with self._lock:
-                    self._playing = False
-            except Exception as e:
-                logger.error(f"Failed to stop playback: {e}")
-    
-    def is_playing(self) -> bool:
-        """Check if currently playing audio."""
-        with self._lock:
-            return self._playing
+    def play_async(self, filename: str) -> Optional[Future]:
+        """
+        Play an audio file asynchronously on the player's worker pool.
         
-        # Try to import pygame
-        try:
-            import pygame
-            self._pygame = pygame
-            
-            # Initialize pygame mixer
-            pygame.mixer.init()
-            pygame.mixer.music.set_volume(self.config.volume)
+        Args:
+            filename: Path to audio file
             
-            logger.info("AudioPlayer initialized successfully")
-        except ImportError:
-            logger.warning("pygame not installed, audio playback will not be available")
-            self._pygame = None
+        Returns:
+            Future resolving to the result of play(), which asyncio callers
+            can await via asyncio.wrap_future, or None if it could not be
+            scheduled
+        """
+        try:
+            return self._pool.submit(self.play, filename, True)
         except Exception as e:
-            logger.error(f"Error initializing audio player: {e}")
-            self._pygame = None
-
-    def play(self, filename: str, blocking: bool = False) -> bool:
+            logger.error(f"Error scheduling playback: {e}")
+            return None
+    
+    def preload(self, paths) -> int:
         """
-        Play an audio file.
+        Decode stock prompts and page them in ahead of their first play.
+        
+        Memory-mapped WAVs are advised with MADV_WILLNEED, so the disk reads
+        happen now rather than when the first alert fires.
         
         Args:
-            filename: Path to audio file
-            blocking: If True, wait for playback to complete
+            paths: Audio file paths
             
         Returns:
-            True if playback started successfully, False otherwise
+            Number of files preloaded
         """
-        if not self._pygame:
-            logger.warning("Audio player not available")
-            return False
-
-        try:
-            file_path = Path(filename)
-            if not file_path.exists():
-                logger.error(f"Audio file not found: {filename}")
-                return False
-
-            # Check file format
-            file_ext = file_path.suffix.lower().lstrip('.')
-            if file_ext not in self.config.supported_formats:
-                logger.warning(f"Unsupported audio format: {file_ext}")
-                # Try to play anyway
+        count = 0
+        for path in paths:
+            try:
+                audio_array, _ = self._load(path)
+            except Exception as e:
+                logger.warning(f"Could not preload {path}: {e}")
+                continue
             
-            with self._lock:
-                # Stop any currently playing audio
-                if self._playing:
-                    self._pygame.mixer.music.stop()
-                
-                # Load and play
-                logger.info(f"Playing audio: {filename}")
-                self._pygame.mixer.music.load(str(file_path))
-                self._pygame.mixer.music.play()
-                self._playing = True
+            base = audio_array
+            while getattr(base, 'base', None) is not None:
+                base = base.base
+            # Newer numpy keeps a memoryview of the map rather than the map
+            if isinstance(base, memoryview):
+                base = base.obj
+            if isinstance(base, mmap.mmap) and hasattr(mmap, 'MADV_WILLNEED'):
+                base.madvise(mmap.MADV_WILLNEED)
             
-            if blocking:
-                # Wait for playback to complete
-                while self._pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                self._playing = False
+            self._preloaded.append(audio_array)
+            count += 1
+        
+        logger.info(f"Preloaded {count} audio file(s)")
+        return count
+    
+    def _load(self, audio_data):
+        """
+        Decode audio, reusing the result of an earlier decode of the same clip.
+        
+        Paths are keyed by modification time and size, so a rewritten file
+        is decoded again, and bytes by content hash. Cached arrays are
+        read-only, so they can be shared between plays.
+        
+        Args:
+            audio_data: Audio bytes (WAV format) or path to an audio file
             
-            return True
+        Returns:
+            Tuple of (audio array, sample rate)
+        """
+        if isinstance(audio_data, str):
+            st = os.stat(audio_data)
+            key = ('path', audio_data, st.st_mtime_ns, st.st_size)
+        else:
+            key = ('buf', hashlib.blake2b(audio_data, digest_size=16).digest())
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
+        audio_array, sample_rate = self._decode(audio_data)
+        audio_array.setflags(write=False)
+        
+        with self._cache_lock:
+            self._cache[key] = (audio_array, sample_rate)
+            if len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+        
+        return audio_array, sample_rate
+    
+    @staticmethod
+    def _decode(audio_data):
+        """
+        Decode WAV audio to an int16 array shaped for sounddevice.
+        
+        File paths are decoded in place rather than read into bytes first.
+        
+        Args:
+            audio_data: Audio bytes (WAV format) or path to an audio file
             
-        except Exception as e:
-            logger.error(f"Error playing audio: {e}")
-            return False
-
-    def play_async(self, filename: str) -> bool:
+        Returns:
+            Tuple of (audio array, sample rate)
+        """
+        if isinstance(audio_data, str):
+            mapped = AudioPlayer._map_wav(audio_data)
+            if mapped is not None:
+                return mapped
+        
+        source = audio_data if isinstance(audio_data, str) else io.BytesIO(audio_data)
+        
+        if sf is not None:
+            return sf.read(source, dtype='int16', always_2d=False)
+        
+        # Fall back to the stdlib parser; frombuffer gives a view, not a copy
+        with wave.open(source, 'rb') as wf:
+            sample_rate = wf.getframerate()
+            channels = wf.getnchannels()
+            frames = wf.readframes(wf.getnframes())
+        
+        audio_array = np.frombuffer(frames, dtype=np.int16)
+        if channels > 1:
+            audio_array = audio_array.reshape(-1, channels)
+        return audio_array, sample_rate
+    
+    @staticmethod
+    def _map_wav(path: str):
         """
-        Play an audio file asynchronously in a separate thread.
+        View the samples of a 16-bit PCM WAV file.
+        
+        Files of at least _MAP_MIN_BYTES are memory-mapped: the array
+        aliases the mapped file, so the OS pages samples in from the page
+        cache on demand and nothing is copied. The map stays open for as
+        long as the array (or the decode cache) references it, and such
+        files must not be truncated in place meanwhile. Smaller clips, which
+        covers stock prompts and notification sounds, are read into memory
+        so later changes to the file cannot affect them.
         
         Args:
-            filename: Path to audio file
+            path: WAV file path
             
         Returns:
-            True if playback thread started successfully, False otherwise
+            Tuple of (audio array, sample rate), or None if the file is not
+            16-bit PCM WAV
         """
-        def _play_thread():
-            self.play(filename, blocking=True)
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < AudioPlayer._MAP_MIN_BYTES:
+                mm = bytearray(size)
+                del mm[f.readinto(mm):]
+            else:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         
         try:
-            thread = threading.Thread(target=_play_thread, daemon=True)
-            thread.start()
-            return True
-        except Exception as e:
-            logger.error(f"Error starting playback thread: {e}")
-            return False
-
+            found = find_pcm_data(mm)
+        except ValueError:
+            return None  # too short to be WAV; left to the general decoder
+        if found is None:
+            return None
+        audio_format, channels, rate, bits, offset, nbytes = found
+        if audio_format != 1 or bits != 16:
+            return None
+        
+        count = (nbytes // (2 * channels)) * channels
+        audio_array = np.frombuffer(mm, dtype='<i2', count=count, offset=offset)
+        if channels > 1:
+            audio_array = audio_array.reshape(-1, channels)
+        return audio_array, rate
+    
     def stop(self) -> bool:
         """
         Stop current playback.
@@ -212,21 +379,23 @@ class AudioPlayer:
         Returns:
             True if successful, False otherwise
         """
-        if not self._pygame:
+        if not self.sd:
             return False
-
+        
         try:
-            with self._lock:
-                if self._playing:
-                    logger.info("Stopping audio playback")
-                    self._pygame.mixer.music.stop()
-                    self._playing = False
+            self._stop_event.set()
+            self._resume_event.set()
+            if self._stream is not None:
+                # Drop queued audio, then keep the stream ready for reuse
+                self._stream.abort()
+                self._stream.start()
+            with self._cond:
+                self._cond.wait_for(lambda: not self._playing, timeout=1.0)
             return True
-            
         except Exception as e:
-            logger.error(f"Error stopping playback: {e}")
+            logger.error(f"Failed to stop playback: {e}")
             return False
-
+    
     def pause(self) -> bool:
         """
         Pause current playback.
@@ -234,20 +403,14 @@ class AudioPlayer:
         Returns:
             True if successful, False otherwise
         """
-        if not self._pygame:
-            return False
-
-        try:
-            with self._lock:
-                if self._playing:
-                    logger.info("Pausing audio playback")
-                    self._pygame.mixer.music.pause()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error pausing playback: {e}")
+        if not self.sd:
             return False
-
+        
+        if self.is_playing():
+            logger.info("Pausing audio playback")
+            self._resume_event.clear()
+        return True
+    
     def resume(self) -> bool:
         """
         Resume paused playback.
@@ -255,19 +418,13 @@ class AudioPlayer:
         Returns:
             True if successful, False otherwise
         """
-        if not self._pygame:
-            return False
-
-        try:
-            with self._lock:
-                logger.info("Resuming audio playback")
-                self._pygame.mixer.music.unpause()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error resuming playback: {e}")
+        if not self.sd:
             return False
-
+        
+        logger.info("Resuming audio playback")
+        self._resume_event.set()
+        return True
+    
     def set_volume(self, volume: float) -> bool:
         """
         Set playback volume.
@@ -278,39 +435,44 @@ class AudioPlayer:
         Returns:
             True if successful, False otherwise
         """
-        if not self._pygame:
-            return False
-
-        try:
-            volume = max(0.0, min(1.0, volume))  # Clamp to 0.0-1.0
-            with self._lock:
-                self._pygame.mixer.music.set_volume(volume)
-                self.config.volume = volume
-                logger.info(f"Set volume to: {volume}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error setting volume: {e}")
-            return False
-
+        volume = max(0.0, min(1.0, volume))  # Clamp to 0.0-1.0
+        self._volume = volume
+        if hasattr(self.config, 'volume'):
+            self.config.volume = volume
+        logger.info(f"Set volume to: {volume}")
+        return True
+    
     def is_playing(self) -> bool:
-        """Check if audio is currently playing."""
-        if not self._pygame:
-            return False
-
-        try:
-            return self._pygame.mixer.music.get_busy()
-        except Exception as e:
-            logger.error(f"Error checking playback status: {e}")
-            return False
-
-    def shutdown(self):
-        """Shutdown the audio player and cleanup resources."""
-        logger.info("Shutting down audio player")
+        """
+        Check if currently playing audio.
         
-        if self._pygame:
+        Reads the flag without taking the lock: it is a single attribute
+        store under the GIL, and polling from chat handlers should never
+        hold up play() or stop().
+        """
+        return self._playing
+    
+    def close(self):
+        """Stop playback and release the output stream."""
+        self._stop_event.set()
+        self._resume_event.set()
+        if self._stream is not None:
             try:
-                self.stop()
-                self._pygame.mixer.quit()
+                # Closing an active stream discards its pending buffers
+                self._stream.close()
             except Exception as e:
-                logger.error(f"Error shutting down audio player: {e}")
+                logger.error(f"Failed to close audio stream: {e}")
+            self._stream = None
+    
+    def shutdown(self):
+        """Shutdown the audio player and cleanup resources."""
+        logger.info("Shutting down audio player")
+        self.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._writer.shutdown(wait=False, cancel_futures=True)
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -1,15 +1,21 @@
-"""Audio recording module."""
-
-import logging
-from typing import Optional
-import time
 """Audio recording using sounddevice."""
 import logging
-import time
+import struct
 import tempfile
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional
-import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
 
 logger = logging.getLogger(__name__)
 
@@ -17,79 +23,353 @@ logger = logging.getLogger(__name__)
 class AudioRecorder:
     """Record audio from microphone."""
     
+    # Streamed chunks held for read_chunk; the oldest are dropped on overflow
+    STREAM_QUEUE_CHUNKS = 64
+    # webrtcvad accepts only 10, 20 or 30 ms frames
+    VAD_FRAME_SECONDS = 0.03
+    # Frames peaking below this int16 amplitude are silence without running VAD
+    VAD_GATE_AMPLITUDE = 500
+    
     def __init__(self, config):
         """Initialize audio recorder."""
         self.config = config
         self.stream = None
+        self._recording = False
+        self._done = threading.Event()
+        self._rec_buf = None
+        self._chunks = deque(maxlen=self.STREAM_QUEUE_CHUNKS)
+        self._chunks_cond = threading.Condition()
+        self._vad = None
+        self._sd = None
+        self._sd_checked = False
         self._initialize()
     
+    @property
+    def sd(self):
+        """
+        sounddevice module, imported on first use.
+        
+        Importing sounddevice loads PortAudio and probes the audio devices,
+        so bots that never record skip it entirely.
+        """
+        if not self._sd_checked:
+            self._sd_checked = True
+            try:
+                import sounddevice as sd
+                self._sd = sd
+                logger.info("Audio recorder initialized")
+            except ImportError:
+                logger.warning("sounddevice not installed, audio recording will not work")
+        return self._sd
+    
     def _initialize(self):
         """Initialize audio input."""
-        try:
-            import sounddevice as sd
-            self.sd = sd
-            logger.info("Audio recorder initialized")
-        except ImportError:
-            logger.warning("sounddevice not installed, audio recording will not work")
-            self.sd = None
+        # webrtcvad-based detector for record_to_file
+        if self.config.vad_enabled:
+            try:
+                from .vad import VoiceActivityDetector
+                self._vad = VoiceActivityDetector(getattr(self.config, 'vad_aggressiveness', 2))
+            except Exception as e:
+                logger.warning(f"Could not initialize VAD: {e}")
     
-    def record(self, timeout: Optional[float] = None, use_vad: bool = True) -> Optional[bytes]:
+    def record(
+        self,
+        timeout: Optional[float] = None,
+        use_vad: bool = True,
+        return_format: str = 'wav',
+        use_raw: bool = False
+    ):
         """
         Record audio until silence or timeout.
         
         Args:
             timeout: Maximum recording time in seconds
             use_vad: Use voice activity detection to stop recording
+            return_format: 'wav' for WAV bytes, or 'pcm' for the raw int16
+                samples, which ASR engines such as faster-whisper accept
+                without re-decoding
+            use_raw: Capture with RawInputStream into a bytearray, skipping
+                the NumPy buffer
             
         Returns:
-            Audio data as bytes or None
+            WAV bytes, PCM samples (int16 ndarray, or bytearray when
+            use_raw is set), or None. Multi-channel audio is mixed down to
+            a 1-D int16 array first when config.downmix_to_mono is set.
         """
         if not self.sd:
             logger.error("Audio recorder not initialized")
             return None
         
         try:
-            import numpy as np
-            
             duration = timeout if timeout else 10.0  # Default 10 seconds
+            total_frames = int(duration * self.config.sample_rate)
             
-            # Record audio
-            audio = self.sd.rec(
-                int(duration * self.config.sample_rate),
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                dtype='int16',
-                device=self.config.device_index
-            )
-            self.sd.wait()
+            # Record audio, stopping early on trailing silence if requested
+            vad = self._silence_detector() if use_vad else None
+            if use_raw:
+                audio = self._record_raw(total_frames, vad)
+            else:
+                audio = self._record_into_buffer(total_frames, vad)
             
-            # Convert to bytes
-            import wave
-            import io
+            channels = self.config.channels
+            if channels > 1 and getattr(self.config, 'downmix_to_mono', False):
+                if use_raw:
+                    audio = np.frombuffer(audio, dtype=np.int16).reshape(-1, channels)
+                # The mix is a new array, so the capture buffer stays reusable
+                audio = self._downmix_to_mono(audio)
+                channels = 1
+            elif return_format == 'pcm' and not use_raw:
+                # Hand the buffer over instead of copying it; the next
+                # recording allocates a fresh one
+                self._rec_buf = None
             
-            buffer = io.BytesIO()
-            with wave.open(buffer, 'wb') as wf:
-                wf.setnchannels(self.config.channels)
-                wf.setsampwidth(2)  # 16-bit audio
-                wf.setframerate(self.config.sample_rate)
-                wf.writeframes(audio.tobytes())
+            if return_format == 'pcm':
+                return audio
             
-            return buffer.getvalue()
+            # Convert to bytes: header and samples joined in one allocation,
+            # reading the array's own memory instead of a tobytes() copy
+            if not isinstance(audio, bytearray):
+                audio = memoryview(np.ascontiguousarray(audio)).cast('B')
+            header = self._wav_header(len(audio), channels, self.config.sample_rate)
+            return b''.join((header, audio))
         except Exception as e:
             logger.error(f"Audio recording failed: {e}")
             return None
     
+    def write_wav(self, path: str, audio) -> bool:
+        """
+        Write recorded PCM straight to a WAV file.
+        
+        Prefer this over writing the bytes from record() to disk: the
+        packed header and the samples' own memory go through a 1 MiB write
+        buffer without an in-memory WAV copy in between.
+        
+        Args:
+            path: Output file path
+            audio: int16 samples as returned by record(return_format='pcm')
+        
+        Returns:
+            True if the file was written
+        """
+        try:
+            channels = self.config.channels
+            if np is not None and isinstance(audio, np.ndarray):
+                channels = 1 if audio.ndim == 1 else audio.shape[1]
+                audio = np.ascontiguousarray(audio, dtype=np.int16)
+            
+            data = memoryview(audio).cast('B')
+            with open(path, 'wb', buffering=1 << 20) as f:
+                f.write(self._wav_header(len(data), channels, self.config.sample_rate))
+                f.write(data)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write WAV file {path}: {e}")
+            return False
+    
+    @staticmethod
+    def _wav_header(nbytes: int, channels: int, sample_rate: int) -> bytes:
+        """
+        Build the 44-byte RIFF header for 16-bit PCM.
+        
+        Args:
+            nbytes: Size of the PCM data in bytes
+            channels: Number of channels
+            sample_rate: Sample rate
+            
+        Returns:
+            WAV header bytes
+        """
+        block_align = channels * 2
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + nbytes, b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate,
+            sample_rate * block_align, block_align, 16,
+            b'data', nbytes
+        )
+    
+    @staticmethod
+    def as_float32(audio):
+        """
+        Scale int16 PCM to float32 in [-1, 1) for ASR models.
+        
+        The conversion and the scale run as one ufunc pass instead of
+        astype() followed by a separate multiply.
+        
+        Args:
+            audio: int16 samples as an ndarray or raw PCM bytes
+            
+        Returns:
+            float32 array with the same shape as the samples
+        """
+        if not isinstance(audio, np.ndarray):
+            audio = np.frombuffer(audio, dtype=np.int16)
+        return np.multiply(audio, np.float32(1.0 / 32768.0), dtype=np.float32)
+    
+    @staticmethod
+    def _downmix_to_mono(audio):
+        """
+        Mix int16 frames down to one channel without leaving integer math.
+        
+        Channels are summed in int32 and divided with a floor (a shift for
+        stereo), avoiding the float64 round trip of mean().
+        
+        Args:
+            audio: int16 audio of shape (frames, channels)
+            
+        Returns:
+            1-D int16 array of frames
+        """
+        channels = audio.shape[1]
+        if channels == 2:
+            mixed = np.add(audio[:, 0], audio[:, 1], dtype=np.int32)
+            mixed >>= 1
+        else:
+            mixed = audio.sum(axis=1, dtype=np.int32)
+            mixed //= channels
+        return mixed.astype(np.int16)
+    
+    def _silence_detector(self):
+        """
+        Build a trailing-silence detector for one recording.
+        
+        Each block's RMS is compared with config.silence_threshold (a
+        fraction of full scale). Once speech has been heard, the detector
+        fires after config.silence_duration seconds of continuous silence.
+        
+        Returns:
+            Function taking an int16 block and returning True when the
+            recording should stop
+        """
+        threshold = getattr(self.config, 'silence_threshold', 0.01) * 32768.0
+        limit = int(getattr(self.config, 'silence_duration', 0.5) * self.config.sample_rate)
+        channels = self.config.channels
+        heard_speech = False
+        silent_frames = 0
+        
+        def update(block) -> bool:
+            nonlocal heard_speech, silent_frames
+            if block.size == 0:
+                return False
+            samples = block.astype(np.int32)
+            rms = np.sqrt(np.mean(np.square(samples)))
+            if rms < threshold:
+                silent_frames += block.size // channels
+            else:
+                heard_speech = True
+                silent_frames = 0
+            return heard_speech and silent_frames >= limit
+        
+        return update
+    
+    def _record_into_buffer(self, total_frames: int, vad=None):
+        """
+        Record into a reusable preallocated buffer.
+        
+        The stream callback copies each block straight into the buffer, which
+        is only reallocated when a longer recording is requested.
+        
+        Args:
+            total_frames: Maximum number of frames to record
+            vad: Optional detector from _silence_detector to stop early
+            
+        Returns:
+            View of the buffer holding the recorded int16 frames
+        """
+        channels = self.config.channels
+        buf = self._rec_buf
+        if buf is None or buf.shape[0] < total_frames or buf.shape[1] != channels:
+            buf = self._rec_buf = np.empty((total_frames, channels), dtype=np.int16)
+        
+        pos = 0
+        done = threading.Event()
+        
+        def callback(indata, frames, time_info, status):
+            nonlocal pos
+            if status:
+                logger.warning(f"Audio callback status: {status}")
+            n = min(frames, total_frames - pos)
+            block = buf[pos:pos + n]
+            block[:] = indata[:n]
+            pos += n
+            if pos >= total_frames or (vad is not None and vad(block)):
+                done.set()
+                raise self.sd.CallbackStop
+        
+        with self.sd.InputStream(
+            samplerate=self.config.sample_rate,
+            channels=channels,
+            dtype='int16',
+            blocksize=self.config.chunk_size,
+            device=self.config.device_index,
+            callback=callback
+        ):
+            done.wait(total_frames / self.config.sample_rate + 1.0)
+        
+        return buf[:pos]
+    
+    def _record_raw(self, total_frames: int, vad=None) -> bytearray:
+        """
+        Record raw int16 PCM straight into a preallocated bytearray.
+        
+        Args:
+            total_frames: Maximum number of frames to record
+            vad: Optional detector from _silence_detector to stop early
+            
+        Returns:
+            Recorded interleaved int16 PCM bytes
+        """
+        frame_bytes = 2 * self.config.channels
+        total_bytes = total_frames * frame_bytes
+        out = bytearray(total_bytes)
+        view = memoryview(out)
+        pos = 0
+        done = threading.Event()
+        
+        def callback(indata, frames, time_info, status):
+            nonlocal pos
+            if status:
+                logger.warning(f"Audio callback status: {status}")
+            n = min(frames * frame_bytes, total_bytes - pos)
+            view[pos:pos + n] = memoryview(indata)[:n]
+            block = np.frombuffer(view[pos:pos + n], dtype=np.int16)
+            pos += n
+            if pos >= total_bytes or (vad is not None and vad(block)):
+                done.set()
+                raise self.sd.CallbackStop
+        
+        with self.sd.RawInputStream(
+            samplerate=self.config.sample_rate,
+            channels=self.config.channels,
+            dtype='int16',
+            blocksize=self.config.chunk_size,
+            device=self.config.device_index,
+            callback=callback
+        ):
+            done.wait(total_frames / self.config.sample_rate + 1.0)
+        
+        view.release()
+        del out[pos:]
+        return out
+    
     def start_stream(self):
         """Start continuous audio stream."""
         if not self.sd:
             return
         
+        with self._chunks_cond:
+            self._chunks.clear()
+        
         try:
-            self.stream = self.sd.InputStream(
+            # One backend block per chunk, so read_chunk never reassembles
+            self.stream = self.sd.RawInputStream(
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 dtype='int16',
-                device=self.config.device_index
+                blocksize=self.config.chunk_size,
+                latency='low',
+                device=self.config.device_index,
+                callback=self._stream_callback
             )
             self.stream.start()
         except Exception as e:
@@ -102,52 +382,32 @@ class AudioRecorder:
             self.stream.close()
             self.stream = None
     
+    def _stream_callback(self, indata, frames, time_info, status):
+        """Queue one block from the continuous stream for read_chunk."""
+        if status:
+            logger.warning(f"Audio stream status: {status}")
+        # The only copy: PortAudio's buffer into the bytes read_chunk returns
+        chunk = bytes(indata)
+        with self._chunks_cond:
+            self._chunks.append(chunk)
+            self._chunks_cond.notify()
+    
     def read_chunk(self) -> Optional[bytes]:
         """Read a chunk from the stream."""
         if not self.stream:
             return None
         
-        try:
-            data, overflowed = self.stream.read(self.config.chunk_size)
-            return data.tobytes()
-        except Exception as e:
-            logger.error(f"Failed to read audio chunk: {e}")
-            return None
-    """Audio recorder using sounddevice for capturing microphone input."""
-
-    def __init__(self, config):
-        """Initialize audio recorder."""
-        self.config = config
-        self._recording = False
-        self._audio_data = []
-        
-        # Try to import sounddevice and soundfile
-        try:
-            import sounddevice as sd
-            import soundfile as sf
-            self._sd = sd
-            self._sf = sf
-            
-            # Initialize VAD if enabled
-            if self.config.vad_enabled:
-                try:
-                    from .vad import VoiceActivityDetector
-                    self._vad = VoiceActivityDetector(self.config.vad_aggressiveness)
-                except Exception as e:
-                    logger.warning(f"Could not initialize VAD: {e}")
-                    self._vad = None
-            else:
-                self._vad = None
-            
-            logger.info("AudioRecorder initialized successfully")
-        except ImportError as e:
-            logger.warning(f"Required audio libraries not installed: {e}")
-            self._sd = None
-            self._sf = None
-
-    def record(self, duration: Optional[int] = None, output_file: Optional[str] = None) -> Optional[str]:
+        # Allow a few block periods before giving up on the device
+        timeout = 4 * self.config.chunk_size / self.config.sample_rate
+        with self._chunks_cond:
+            if not self._chunks_cond.wait_for(lambda: self._chunks, timeout):
+                logger.error("Timed out waiting for audio chunk")
+                return None
+            return self._chunks.popleft()
+    
+    def record_to_file(self, duration: Optional[int] = None, output_file: Optional[str] = None) -> Optional[str]:
         """
-        Record audio from microphone.
+        Record audio from microphone to a file.
         
         Args:
             duration: Recording duration in seconds (None for VAD-based)
@@ -156,10 +416,10 @@ class AudioRecorder:
         Returns:
             Path to recorded file or None if failed
         """
-        if not self._sd or not self._sf:
+        if not self.sd or sf is None:
             logger.warning("Audio recording not available")
             return None
-
+        
         try:
             logger.info(f"Starting audio recording (duration: {duration or 'VAD-based'})")
             
@@ -177,132 +437,239 @@ class AudioRecorder:
         except Exception as e:
             logger.error(f"Error recording audio: {e}")
             return None
-
+    
     def _record_fixed_duration(self, duration: int, output_file: Optional[str] = None) -> Optional[str]:
         """Record audio for a fixed duration."""
         try:
             # Record audio
             logger.info(f"Recording for {duration} seconds...")
-            recording = self._sd.rec(
+            recording = self.sd.rec(
                 int(duration * self.config.sample_rate),
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 dtype='int16'
             )
-            self._sd.wait()
-            
-            # Save to file
-            if not output_file:
-                temp_file = tempfile.NamedTemporaryFile(
-                    suffix=f".{self.config.format}",
-                    delete=False
-                )
-                output_file = temp_file.name
-                temp_file.close()
-            
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            self._sf.write(str(output_path), recording, self.config.sample_rate)
-            logger.info(f"Audio saved to: {output_path}")
+            self.sd.wait()
             
-            return str(output_path)
+            return self._save(recording, output_file)
             
         except Exception as e:
             logger.error(f"Error in fixed duration recording: {e}")
             return None
-
+    
     def _record_with_vad(self, output_file: Optional[str] = None) -> Optional[str]:
         """Record audio using Voice Activity Detection."""
         if not self._vad:
             logger.warning("VAD not available")
             return None
-
+        
         try:
             logger.info("Recording with VAD (speak now)...")
             
+            # Blocks are copied into one reusable buffer sized for the
+            # 30 second limit, so the callback never allocates
+            timeout = 30
+            channels = self.config.channels
+            max_frames = timeout * self.config.sample_rate
+            buf = self._rec_buf
+            if buf is None or buf.shape[0] < max_frames or buf.shape[1] != channels:
+                buf = self._rec_buf = np.empty((max_frames, channels), dtype=np.int16)
+            pos = 0
+            
+            # Whole VAD frames per block, as close to chunk_size as possible,
+            # so every callback hands the worker complete frames
+            frame_size = int(self.VAD_FRAME_SECONDS * self.config.sample_rate)
+            blocksize = frame_size * max(1, self.config.chunk_size // frame_size)
+            
+            # 16-bit WAV output is streamed to disk by the worker while
+            # recording, leaving only the header to patch at the end
+            wav_file = None
+            written = 0
+            output_path = self._output_path(output_file)
+            if output_path.lower().endswith('.wav'):
+                wav_file = open(output_path, 'wb', buffering=1 << 20)
+                wav_file.write(self._wav_header(0, channels, self.config.sample_rate))
+            
             self._recording = True
-            self._audio_data = []
-            silence_start = None
+            self._done.clear()
+            data_ready = threading.Event()
+            
+            def flush():
+                """Append samples recorded since the last flush to the WAV."""
+                nonlocal written
+                end = pos
+                if wav_file is not None and end > written:
+                    wav_file.write(memoryview(buf[written:end]).cast('B'))
+                    written = end
             
             def audio_callback(indata, frames, time_info, status):
                 """Callback for audio stream."""
+                nonlocal pos
                 if status:
                     logger.warning(f"Audio callback status: {status}")
                 
+                # Only copy here; VAD runs on the worker so the audio
+                # thread never waits on it
                 if self._recording:
-                    self._audio_data.append(indata.copy())
+                    n = min(frames, max_frames - pos)
+                    buf[pos:pos + n] = indata[:n]
+                    pos += n
+                    data_ready.set()
+                    if pos >= max_frames:
+                        self._recording = False
+                        self._done.set()
+            
+            def vad_worker():
+                """Run VAD over frames as the callback appends them."""
+                # The callback is the only writer and only moves pos forward,
+                # so the worker can read up to pos without a lock. VAD sees
+                # exact VAD_FRAME_SECONDS frames of the first channel; a
+                # partial frame (only at the buffer's end) waits for more.
+                vad_pos = 0
+                silent_frames = 0
+                silence_limit = int(self.config.silence_duration * self.config.sample_rate)
+                # webrtcvad takes any bytes-like object, so each frame is
+                # copied into one reusable buffer instead of a new bytes
+                frame_buf = np.empty(frame_size, dtype=np.int16)
+                frame_view = memoryview(frame_buf).cast('B')
+                while True:
+                    data_ready.wait()
+                    data_ready.clear()
+                    if self._done.is_set():
+                        return
+                    
+                    flush()
+                    # Read pos once; the callback may advance it meanwhile
+                    cur = pos
+                    end = cur - (cur - vad_pos) % frame_size
+                    if end == vad_pos:
+                        continue
                     
-                    # Check for voice activity
-                    if self._vad:
-                        is_speech = self._vad.is_speech(
-                            indata.tobytes(),
-                            self.config.sample_rate
-                        )
-                        
-                        nonlocal silence_start
-                        if not is_speech:
-                            if silence_start is None:
-                                silence_start = time.time()
-                            elif time.time() - silence_start >= self.config.silence_duration:
-                                self._recording = False
+                    # Gate all new frames in one vectorised pass; only frames
+                    # loud enough to be speech go to webrtcvad
+                    frames = buf[vad_pos:end, 0].reshape(-1, frame_size)
+                    gate = self.VAD_GATE_AMPLITUDE
+                    loud = (frames.max(axis=1) >= gate) | (frames.min(axis=1) <= -gate)
+                    for frame, is_loud in zip(frames, loud):
+                        if is_loud:
+                            np.copyto(frame_buf, frame)
+                            is_speech = self._vad.is_speech(frame_view, self.config.sample_rate)
                         else:
-                            silence_start = None
+                            is_speech = False
+                        if is_speech:
+                            silent_frames = 0
+                        else:
+                            silent_frames += frame_size
+                    vad_pos = end
+                    
+                    if silent_frames >= silence_limit:
+                        self._recording = False
+                        self._done.set()
+                        return
+            
+            worker = threading.Thread(target=vad_worker, daemon=True)
+            worker.start()
             
             # Start recording stream
-            with self._sd.InputStream(
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                dtype='int16',
-                callback=audio_callback
-            ):
-                # Wait for recording to complete or timeout (30 seconds max)
-                timeout = 30
-                start_time = time.time()
-                while self._recording and (time.time() - start_time) < timeout:
-                    time.sleep(0.1)
+            try:
+                with self.sd.InputStream(
+                    samplerate=self.config.sample_rate,
+                    channels=self.config.channels,
+                    dtype='int16',
+                    blocksize=blocksize,
+                    latency='low',
+                    device=self.config.device_index,
+                    callback=audio_callback
+                ):
+                    # Wake as soon as the worker, the callback or
+                    # stop_recording() ends the recording instead of polling
+                    self._done.wait(timeout=timeout)
+                    self._recording = False
+            finally:
+                self._done.set()
+                data_ready.set()
+                worker.join()
+                if wav_file is not None:
+                    try:
+                        flush()
+                        wav_file.seek(0)
+                        wav_file.write(self._wav_header(written * channels * 2, channels, self.config.sample_rate))
+                    finally:
+                        wav_file.close()
             
-            if not self._audio_data:
+            if not pos:
                 logger.warning("No audio data recorded")
+                if wav_file is not None:
+                    Path(output_path).unlink(missing_ok=True)
                 return None
             
-            # Concatenate audio data
-            import numpy as np
-            audio_array = np.concatenate(self._audio_data, axis=0)
-            
-            # Save to file
-            if not output_file:
-                temp_file = tempfile.NamedTemporaryFile(
-                    suffix=f".{self.config.format}",
-                    delete=False
-                )
-                output_file = temp_file.name
-                temp_file.close()
-            
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if wav_file is not None:
+                logger.info(f"Audio saved to: {output_path}")
+                return output_path
             
-            self._sf.write(str(output_path), audio_array, self.config.sample_rate)
-            logger.info(f"Audio saved to: {output_path}")
-            
-            return str(output_path)
+            return self._save(buf[:pos], output_path)
             
         except Exception as e:
             logger.error(f"Error in VAD recording: {e}")
             return None
-
+    
+    def _output_path(self, output_file: Optional[str] = None) -> str:
+        """
+        Resolve where a recording is written, creating its directory.
+        
+        Args:
+            output_file: Output filename, or None for a temporary file
+            
+        Returns:
+            Output file path
+        """
+        if not output_file:
+            temp_file = tempfile.NamedTemporaryFile(
+                suffix=f".{getattr(self.config, 'format', 'wav')}",
+                delete=False
+            )
+            output_file = temp_file.name
+            temp_file.close()
+        
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        return output_file
+    
+    def _save(self, audio, output_file: Optional[str] = None) -> str:
+        """
+        Write a recording in the configured format.
+        
+        Args:
+            audio: int16 samples of shape (frames, channels)
+            output_file: Output filename, or None for a temporary file
+            
+        Returns:
+            Path to the written file
+        """
+        output_path = Path(self._output_path(output_file))
+        
+        if output_path.suffix.lower() == '.wav' and audio.dtype == np.int16:
+            # Plain 16-bit PCM needs no libsndfile round trip
+            if not self.write_wav(str(output_path), audio):
+                raise OSError(f"Could not write {output_path}")
+        else:
+            sf.write(str(output_path), audio, self.config.sample_rate)
+        logger.info(f"Audio saved to: {output_path}")
+        
+        return str(output_path)
+    
     def stop_recording(self):
         """Stop current recording."""
         logger.info("Stopping recording")
         self._recording = False
-
+        self._done.set()
+    
     def get_devices(self):
         """Get list of available audio devices."""
-        if not self._sd:
+        if not self.sd:
             return []
-
+        
         try:
-            devices = self._sd.query_devices()
+            devices = self.sd.query_devices()
             return devices
         except Exception as e:
             logger.error(f"Error getting audio devices: {e}")
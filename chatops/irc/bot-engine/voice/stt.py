@@ -1,112 +1,490 @@
-"""Speech-to-Text engine."""
-
-import logging
 """Speech-to-Text engine using OpenAI Whisper."""
+import asyncio
+import io
 import logging
+import os
+import shutil
+import subprocess
 import tempfile
-from pathlib import Path
-from typing import Optional
+import threading
+import warnings
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import gcd
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
 
 logger = logging.getLogger(__name__)
 
+# Sample rate Whisper models expect
+WHISPER_SAMPLE_RATE = 16000
+
+# Loaded models kept resident for change_model() to switch back to
+MODEL_CACHE_SIZE = 2
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def _load_cached_model(factory, model: str, **options):
+    """
+    Construct a Whisper model once per backend, name and options.
+    
+    The cache is shared by every STTEngine, so engines configured alike hold
+    one copy of the weights. Failed loads raise and are not cached.
+    
+    Args:
+        factory: Backend constructor, e.g. faster_whisper.WhisperModel
+        model: Model name or directory
+        **options: Constructor keyword arguments (hashable values)
+        
+    Returns:
+        The loaded model
+    """
+    return factory(model, **options)
+
+
+def _load_openvino_whisper(model_id: str, cache_dir: Optional[str] = None):
+    """
+    Load a Whisper checkpoint exported to OpenVINO with int8 weights.
+    
+    The export and weight quantization run once; the result is saved under
+    cache_dir and loaded directly on later starts.
+    
+    Args:
+        model_id: Hugging Face model id, e.g. openai/whisper-base
+        cache_dir: Directory for the exported model and the OpenVINO
+            CACHE_DIR for compiled blobs reused across starts
+        
+    Returns:
+        Tuple of (processor, OVModelForSpeechSeq2Seq)
+    """
+    from optimum.intel.openvino import OVModelForSpeechSeq2Seq
+    from transformers import AutoProcessor
+    
+    ov_config = {"CACHE_DIR": cache_dir} if cache_dir else None
+    export_dir = os.path.join(cache_dir, model_id.replace("/", "--")) if cache_dir else None
+    
+    if export_dir and os.path.isfile(os.path.join(export_dir, "config.json")):
+        model = OVModelForSpeechSeq2Seq.from_pretrained(
+            export_dir,
+            export=False,
+            ov_config=ov_config
+        )
+        return AutoProcessor.from_pretrained(export_dir), model
+    
+    model = OVModelForSpeechSeq2Seq.from_pretrained(
+        model_id,
+        export=True,
+        load_in_8bit=True,
+        ov_config=ov_config
+    )
+    processor = AutoProcessor.from_pretrained(model_id)
+    
+    if export_dir:
+        try:
+            # Save beside the target and rename, so an interrupted save is
+            # never mistaken for a finished export
+            tmp_dir = f"{export_dir}.tmp{os.getpid()}"
+            model.save_pretrained(tmp_dir)
+            processor.save_pretrained(tmp_dir)
+            os.replace(tmp_dir, export_dir)
+        except OSError as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            logger.warning(f"Could not save OpenVINO export to {export_dir}: {e}")
+    return processor, model
+
+
+def _to_whisper_input(pcm, sample_rate: int, channels: int = 1):
+    """
+    Convert int16 PCM to the mono 16 kHz float32 array Whisper accepts.
+    
+    Args:
+        pcm: int16 samples as raw bytes or an ndarray
+        sample_rate: Sample rate of the PCM
+        channels: Interleaved channel count of raw bytes
+        
+    Returns:
+        Mono float32 array at WHISPER_SAMPLE_RATE
+    """
+    if not isinstance(pcm, np.ndarray):
+        pcm = np.frombuffer(pcm, dtype=np.int16)
+        if channels > 1:
+            pcm = pcm.reshape(-1, channels)
+    
+    # Scale in a single pass instead of astype() followed by a multiply
+    audio = np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        from scipy.signal import resample_poly
+        g = gcd(WHISPER_SAMPLE_RATE, sample_rate)
+        audio = resample_poly(audio, WHISPER_SAMPLE_RATE // g, sample_rate // g).astype(np.float32)
+    
+    return audio
+
 
 class STTEngine:
-    """Speech-to-Text engine wrapper."""
+    """Speech-to-text engine using OpenAI Whisper for local transcription.
+    
+    The Whisper backend is imported and the model loaded on first use, so
+    bots that never transcribe do not pay for torch or CTranslate2.
+    Setting config.engine to "whispercpp" uses whisper.cpp's quantized GGML
+    models through pywhispercpp instead, and "openvino" runs an int8 export
+    on OpenVINO through optimum-intel.
+    """
     
+    # transcribe_long() cuts chunks of at most this length, preferably at a
+    # pause found after MIN_CHUNK_SECONDS
+    LONG_CHUNK_SECONDS = 30
+    MIN_CHUNK_SECONDS = 15
+    VAD_FRAME_SECONDS = 0.03
+    # Segments per forward pass in transcribe_batch()
+    BATCH_SIZE = 8
+    # GGML quantization used by the whispercpp engine unless compute_type is set
+    WHISPERCPP_QUANTIZATION = "q5_1"
+
     def __init__(self, config):
         """Initialize STT engine."""
         self.config = config
-        self.model = None
-        self._initialize_engine()
-    
-    def _initialize_engine(self):
-        """Initialize the STT backend."""
+        self._model = None
+        self._whisper = None
+        self._faster_whisper = None
+        self._whispercpp = None
+        self._openvino = None
+        self._backend_checked = False
+        self._pool = None
+        self._executor = None
+        self._batched = None
+        self._vad = None
+        # Serialises model loads between the preload thread and callers
+        self._load_lock = threading.Lock()
+        logger.info(f"STTEngine initialized with model: {self.config.model}")
+        
+        if getattr(self.config, 'preload_model', False):
+            self.preload()
+
+    def preload(self) -> threading.Thread:
+        """
+        Start loading the model in the background.
+        
+        The first transcription waits for the load to finish instead of
+        starting its own, so the load overlaps with the rest of startup.
+        
+        Returns:
+            The daemon thread doing the load
+        """
+        thread = threading.Thread(target=self._ensure_model, name="stt-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _import_backend(self):
+        """
+        Import the Whisper backend on first call.
+        
+        Callers hold _load_lock. The checked flag is set only once a
+        backend has been imported and its attributes assigned, so a failed
+        import is retried on the next call.
+        
+        Returns:
+            The backend module, or None if no Whisper package is installed
+        """
+        if self._backend_checked:
+            return self._whisper
+        
+        engine = getattr(self.config, 'engine', 'whisper')
+        if engine == "whispercpp":
+            try:
+                import pywhispercpp.model
+                self._whispercpp = pywhispercpp.model
+                self._whisper = pywhispercpp.model
+            except ImportError:
+                logger.warning("pywhispercpp not installed, STT will not be available")
+        elif engine == "openvino":
+            try:
+                import optimum.intel.openvino
+                self._openvino = optimum.intel.openvino
+                self._whisper = optimum.intel.openvino
+            except ImportError:
+                logger.warning("optimum-intel not installed, STT will not be available")
+        else:
+            # Prefer faster-whisper (CTranslate2, int8); fall back to openai-whisper
+            try:
+                import faster_whisper
+                self._faster_whisper = faster_whisper
+                self._whisper = faster_whisper
+            except ImportError:
+                try:
+                    import whisper
+                    self._whisper = whisper
+                except ImportError:
+                    logger.warning("whisper not installed, STT will not be available")
+        
+        self._backend_checked = self._whisper is not None
+        return self._whisper
+
+    def _ensure_model(self):
+        """
+        Load the configured model if it is not loaded yet.
+        
+        Returns:
+            The loaded model, or None if it is unavailable
+        """
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._load_model()
+        return self._model
+
+    def _load_model(self):
+        """Load the Whisper model."""
+        if not self._import_backend():
+            return
+
+        # int8 weights; keep float16 activations on GPU
+        compute_type = getattr(self.config, 'compute_type', None)
+        if not compute_type:
+            if self._whispercpp:
+                compute_type = self.WHISPERCPP_QUANTIZATION
+            else:
+                compute_type = "int8" if self.config.device == "cpu" else "int8_float16"
+        if self._whispercpp:
+            # Quantized GGML weights, e.g. small-q5_1, fetched on first use
+            factory = self._whispercpp.Model
+            model = f"{self.config.model}-{compute_type}"
+            options = {"n_threads": os.cpu_count() or 4}
+        elif self._openvino:
+            # int8 weights run on VNNI dot-product kernels where the CPU has them
+            factory = _load_openvino_whisper
+            model = f"openai/whisper-{self.config.model}"
+            cache_dir = getattr(self.config, 'model_cache_dir', None)
+            options = {"cache_dir": os.path.join(cache_dir, "openvino") if cache_dir else None}
+        elif self._faster_whisper:
+            factory = self._faster_whisper.WhisperModel
+            model = self._converted_model(compute_type) or self.config.model
+            options = {
+                "device": self.config.device,
+                "compute_type": compute_type,
+                "cpu_threads": getattr(self.config, 'cpu_threads', 4),
+                # One CTranslate2 worker per transcribe_long() thread
+                "num_workers": self._pool_size(),
+            }
+        else:
+            factory = self._whisper.load_model
+            model = self.config.model
+            options = {"device": self.config.device}
+
         try:
-            if self.config.stt_engine == "whisper":
-                import whisper
-                self.model = whisper.load_model(self.config.stt_model)
-                logger.info(f"Whisper STT model '{self.config.stt_model}' loaded")
+            before = _load_cached_model.cache_info()
+            self._model = _load_cached_model(factory, model, **options)
+            after = _load_cached_model.cache_info()
+            if after.hits > before.hits:
+                logger.info(f"Using cached Whisper model: {self.config.model}")
             else:
-                logger.warning(f"Unsupported STT engine: {self.config.stt_engine}")
-        except ImportError:
-            logger.warning("whisper not installed, STT will not work")
+                logger.info(f"Loaded Whisper model: {self.config.model}")
+                if before.currsize == MODEL_CACHE_SIZE:
+                    # A model was evicted; hand its cached CUDA blocks back
+                    self._release_gpu_memory()
         except Exception as e:
-            logger.error(f"Failed to load STT model: {e}")
-    
-    def transcribe(self, audio_data: bytes) -> str:
+            logger.error(f"Error loading Whisper model: {e}")
+            self._model = None
+
+    def _converted_model(self, compute_type: str) -> Optional[str]:
+        """
+        Get the on-disk CTranslate2 copy of the model, converting it once.
+        
+        faster-whisper otherwise re-quantizes the downloaded float16 weights
+        on every start; a model already stored as compute_type loads
+        straight from disk.
+        
+        Args:
+            compute_type: CTranslate2 quantization to store
+            
+        Returns:
+            Path to the converted model directory, or None if
+            config.model_cache_dir is unset or the conversion failed
+        """
+        cache_dir = getattr(self.config, 'model_cache_dir', None)
+        if not cache_dir:
+            return None
+        
+        model_dir = os.path.join(cache_dir, f"{self.config.model}-{compute_type}")
+        if os.path.isfile(os.path.join(model_dir, "model.bin")):
+            return model_dir
+        
+        try:
+            logger.info(f"Converting Whisper model {self.config.model} to {compute_type}: {model_dir}")
+            subprocess.run(
+                [
+                    "ct2-transformers-converter",
+                    "--model", f"openai/whisper-{self.config.model}",
+                    "--output_dir", model_dir,
+                    "--quantization", compute_type,
+                    "--copy_files", "tokenizer.json", "preprocessor_config.json",
+                    "--force",
+                ],
+                check=True,
+                capture_output=True
+            )
+            return model_dir
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error(f"Error converting Whisper model, loading it by name: {e}")
+            return None
+
+    def _release_gpu_memory(self):
+        """Return cached CUDA blocks freed by an evicted model."""
+        if self.config.device == "cpu":
+            return
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def _to_model_input(self, pcm, sample_rate: int, channels: int = 1):
+        """
+        Convert int16 PCM to the input the loaded backend takes.
+        
+        openai-whisper on a GPU accepts a tensor, so mono 16 kHz PCM is
+        copied to the device as int16, half the bytes of float32, and only
+        converted and scaled there. Everything else goes through
+        _to_whisper_input.
+        
+        Args:
+            pcm: int16 samples as raw bytes or an ndarray
+            sample_rate: Sample rate of the PCM
+            channels: Interleaved channel count of raw bytes
+            
+        Returns:
+            A float32 tensor on config.device or a float32 ndarray
+        """
+        if (self._faster_whisper is None and self._whispercpp is None and self._openvino is None
+                and self.config.device != "cpu"
+                and channels == 1 and sample_rate == WHISPER_SAMPLE_RATE):
+            samples = pcm if isinstance(pcm, np.ndarray) else np.frombuffer(pcm, dtype=np.int16)
+            if samples.ndim == 1:
+                try:
+                    import torch
+                except ImportError:
+                    pass
+                else:
+                    # The view is only read while copying to the device, so
+                    # the warning about wrapping read-only bytes does not apply
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", UserWarning)
+                        view = torch.from_numpy(samples)
+                    # Copy as int16 and cast on the device; a combined
+                    # to(device, dtype) would cast on the host first
+                    return view.to(self.config.device, non_blocking=True).float().mul_(1.0 / 32768.0)
+        
+        return _to_whisper_input(pcm, sample_rate, channels)
+
+    def transcribe(self, audio_data, sample_rate: Optional[int] = None) -> str:
         """
         Convert audio to text.
         
         Args:
-            audio_data: Raw audio bytes
+            audio_data: Encoded audio bytes (WAV, FLAC, OGG, MP3, ...), raw
+                int16 PCM bytes when sample_rate is given, or an int16
+                ndarray as returned by AudioRecorder.record(return_format='pcm')
+            sample_rate: Sample rate of raw PCM; marks audio_data as raw
+                PCM rather than an encoded file. ndarrays default to
+                config.sample_rate
             
         Returns:
             Transcribed text
         """
-        if not self.model:
+        if not self._ensure_model():
             logger.error("STT model not initialized")
             return ""
         
         try:
-            import tempfile
-            import os
+            if sample_rate is not None or (np is not None and isinstance(audio_data, np.ndarray)):
+                audio = self._to_model_input(
+                    audio_data,
+                    sample_rate or getattr(self.config, 'sample_rate', WHISPER_SAMPLE_RATE)
+                )
+            else:
+                audio = self._decode_in_memory(audio_data)
             
-            temp_file = None
+            if audio is not None:
+                return self._transcribe(audio)
+            
+            # Formats neither wave nor libsndfile read go to the backend's
+            # own decoder through a file, as before
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(audio_data)
+                temp_file = f.name
             try:
-                # Save audio data to temporary file
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                    temp_file = f.name
-                    f.write(audio_data)
-                
-                # Transcribe
-                result = self.model.transcribe(
-                    temp_file,
-                    language=self.config.stt_language,
-                    fp16=False
-                )
-                
-                return result.get("text", "").strip()
+                return self._transcribe(temp_file)
             finally:
-                if temp_file and os.path.exists(temp_file):
-                    os.unlink(temp_file)
+                os.unlink(temp_file)
         except Exception as e:
             logger.error(f"STT transcription failed: {e}")
             return ""
-    """Speech-to-text engine using OpenAI Whisper for local transcription."""
 
-    def __init__(self, config):
-        """Initialize STT engine."""
-        self.config = config
-        self._model = None
+    def _decode_in_memory(self, audio_data: bytes):
+        """
+        Decode encoded audio bytes without a temp file where possible.
         
-        # Try to import whisper
-        try:
-            import whisper
-            self._whisper = whisper
-            self._load_model()
-            logger.info(f"STTEngine initialized with model: {self.config.model}")
-        except ImportError:
-            logger.warning("whisper not installed, STT will not be available")
-            self._whisper = None
-        except Exception as e:
-            logger.error(f"Error initializing STT engine: {e}")
-            self._whisper = None
-
-    def _load_model(self):
-        """Load the Whisper model."""
-        if not self._whisper:
-            return
+        16-bit PCM WAV is read with the stdlib wave module; anything else
+        libsndfile understands (other WAV sample widths, float WAV, FLAC,
+        OGG, recent MP3) goes through soundfile.
+        
+        Args:
+            audio_data: Encoded audio bytes
+            
+        Returns:
+            Model input, or None if the bytes could not be decoded here
+        """
+        if audio_data[:4] == b'RIFF':
+            try:
+                with wave.open(io.BytesIO(audio_data), 'rb') as wf:
+                    if wf.getsampwidth() == 2:
+                        sample_rate = wf.getframerate()
+                        channels = wf.getnchannels()
+                        frames = wf.readframes(wf.getnframes())
+                        return self._to_model_input(frames, sample_rate, channels)
+            except wave.Error:
+                pass  # e.g. float WAV, which soundfile handles
+        
+        if sf is not None:
+            try:
+                pcm, sample_rate = sf.read(io.BytesIO(audio_data), dtype='int16')
+                return self._to_model_input(pcm, sample_rate)
+            except RuntimeError:
+                pass  # format libsndfile cannot read
+        
+        return None
 
-        try:
-            logger.info(f"Loading Whisper model: {self.config.model}")
-            self._model = self._whisper.load_model(
-                self.config.model,
-                device=self.config.device
-            )
-            logger.info("Whisper model loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading Whisper model: {e}")
-            self._model = None
+    async def transcribe_async(self, audio_data, sample_rate: Optional[int] = None) -> str:
+        """
+        Convert audio to text without blocking the event loop.
+        
+        The Whisper pass runs on a small dedicated thread pool, so IRC I/O
+        and playback keep going while it decodes.
+        
+        Args:
+            audio_data: Audio as for transcribe()
+            sample_rate: Sample rate of raw PCM, as for transcribe()
+            
+        Returns:
+            Transcribed text
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stt-async")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.transcribe, audio_data, sample_rate)
 
     def transcribe_file(self, audio_file: str) -> Optional[str]:
         """
@@ -118,68 +496,283 @@ class STTEngine:
         Returns:
             Transcribed text or None if failed
         """
-        if not self._model:
+        if not self._ensure_model():
             logger.warning("STT model not available, cannot transcribe")
             return None
 
         try:
             logger.info(f"Transcribing audio file: {audio_file}")
+            return self._transcribe(audio_file)
             
-            # Transcribe with Whisper
+        except Exception as e:
+            logger.error(f"Error transcribing audio: {e}")
+            return None
+
+    def _transcribe(self, audio) -> str:
+        """
+        Run the loaded model over a file path or 16 kHz float32 samples.
+        
+        Args:
+            audio: Audio file path, or mono float32 array or tensor at 16 kHz
+            
+        Returns:
+            Transcribed text
+        """
+        language = self.config.language if self.config.language != "auto" else None
+        
+        if self._faster_whisper:
+            # Segments are generated lazily as decoding proceeds
+            # faster-whisper's built-in Silero VAD skips silent stretches
+            # before they reach the encoder
+            vad_filter = getattr(self.config, 'vad_filter', True)
+            segments, _ = self._model.transcribe(
+                audio,
+                language=language,
+                beam_size=getattr(self.config, 'beam_size', 1),
+                vad_filter=vad_filter,
+                vad_parameters={
+                    "min_silence_duration_ms": getattr(self.config, 'vad_min_silence_ms', 500)
+                } if vad_filter else None
+            )
+            text = "".join(segment.text for segment in segments).strip()
+        elif self._whispercpp:
+            params = {"language": language} if language else {}
+            segments = self._model.transcribe(audio, **params)
+            text = " ".join(segment.text.strip() for segment in segments).strip()
+        elif self._openvino:
+            text = self._transcribe_openvino(audio, language)
+        else:
+            # Half precision on GPU; on CPU say so up front instead of having
+            # whisper warn and fall back to fp32 on every call
             result = self._model.transcribe(
-                audio_file,
-                language=self.config.language if self.config.language != "auto" else None
+                audio,
+                language=language,
+                fp16=self.config.device != "cpu"
             )
-            
             text = result.get("text", "").strip()
-            logger.info(f"Transcription result: {text[:100]}...")
-            
-            return text
+        logger.info(f"Transcription result: {text[:100]}...")
+        
+        return text
+
+    def _transcribe_openvino(self, audio, language: Optional[str]) -> str:
+        """
+        Decode up to 30 seconds of audio with the OpenVINO model.
+        
+        Args:
+            audio: Audio file path or mono float32 array at 16 kHz
+            language: Language code, or None to detect it
             
-        except Exception as e:
-            logger.error(f"Error transcribing audio: {e}")
-            return None
+        Returns:
+            Transcribed text
+        """
+        if isinstance(audio, str):
+            if sf is None:
+                raise ImportError("soundfile required to read audio files. Install with: pip install soundfile")
+            pcm, sample_rate = sf.read(audio, dtype='int16')
+            audio = _to_whisper_input(pcm, sample_rate)
+        
+        processor, model = self._model
+        features = processor(
+            audio, sampling_rate=WHISPER_SAMPLE_RATE, return_tensors="pt"
+        ).input_features
+        params = {"language": language} if language else {}
+        token_ids = model.generate(features, task="transcribe", **params)
+        return processor.batch_decode(token_ids, skip_special_tokens=True)[0].strip()
 
     def transcribe_realtime(self, audio_data: bytes, sample_rate: int = 16000) -> Optional[str]:
         """
         Transcribe audio data in real-time.
         
         Args:
-            audio_data: Raw audio bytes
+            audio_data: int16 PCM as raw mono bytes, or an ndarray of shape
+                (frames,) or (frames, channels)
             sample_rate: Sample rate of audio
             
         Returns:
             Transcribed text or None if failed
         """
-        if not self._model:
+        if not self._ensure_model():
             logger.warning("STT model not available, cannot transcribe")
             return None
 
         try:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-                
-                # Write audio data
-                import soundfile as sf
-                import numpy as np
-                
-                # Convert bytes to numpy array
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                sf.write(temp_path, audio_array, sample_rate)
-                
-                # Transcribe
-                result = self.transcribe_file(temp_path)
-                
-                # Clean up
-                Path(temp_path).unlink(missing_ok=True)
-                
-                return result
+            # Hand Whisper the samples directly instead of a temp WAV that
+            # it would decode again through an ffmpeg subprocess
+            return self._transcribe(self._to_model_input(audio_data, sample_rate))
                 
         except Exception as e:
             logger.error(f"Error transcribing realtime audio: {e}")
             return None
 
+    def transcribe_long(self, audio_data: bytes, sample_rate: int = 16000) -> Optional[str]:
+        """
+        Transcribe a long recording in chunks decoded concurrently.
+        
+        The audio is cut at pauses into chunks of at most
+        LONG_CHUNK_SECONDS. With faster-whisper the chunks are decoded on a
+        thread pool, since CTranslate2 releases the GIL during inference;
+        openai-whisper decodes them one after another.
+        
+        Args:
+            audio_data: int16 PCM samples as raw bytes or an ndarray
+            sample_rate: Sample rate of audio
+            
+        Returns:
+            Transcribed text or None if failed
+        """
+        if not self._ensure_model():
+            logger.warning("STT model not available, cannot transcribe")
+            return None
+
+        try:
+            audio = _to_whisper_input(audio_data, sample_rate)
+            chunks = [audio[start:end] for start, end in self._chunk_bounds(audio)]
+            
+            if self._faster_whisper and len(chunks) > 1:
+                texts = self._get_pool().map(self._transcribe, chunks)
+            else:
+                texts = map(self._transcribe, chunks)
+            
+            return " ".join(text for text in texts if text)
+                
+        except Exception as e:
+            logger.error(f"Error transcribing long audio: {e}")
+            return None
+
+    def transcribe_batch(self, clips: List[bytes], sample_rate: int = 16000) -> List[str]:
+        """
+        Transcribe several clips, such as voice memos from different users.
+        
+        With faster-whisper each clip goes through BatchedInferencePipeline,
+        which runs up to BATCH_SIZE of its speech segments per encoder pass,
+        and the clips themselves are decoded concurrently on the thread
+        pool. Other backends decode the clips one after another.
+        
+        Args:
+            clips: int16 PCM samples per clip, as raw bytes or ndarrays
+            sample_rate: Sample rate of the clips
+            
+        Returns:
+            Transcribed text per clip, in order; "" for clips that failed
+        """
+        if not self._ensure_model():
+            logger.warning("STT model not available, cannot transcribe")
+            return [""] * len(clips)
+        
+        def decode(clip) -> str:
+            try:
+                return self._transcribe_batched(_to_whisper_input(clip, sample_rate))
+            except Exception as e:
+                logger.error(f"Error transcribing batched clip: {e}")
+                return ""
+        
+        if self._faster_whisper and len(clips) > 1:
+            return list(self._get_pool().map(decode, clips))
+        return [decode(clip) for clip in clips]
+
+    def _transcribe_batched(self, audio) -> str:
+        """
+        Run one clip through faster-whisper's batched pipeline if available.
+        
+        Args:
+            audio: Mono float32 array at 16 kHz
+            
+        Returns:
+            Transcribed text
+        """
+        pipeline_class = getattr(self._faster_whisper, 'BatchedInferencePipeline', None)
+        if pipeline_class is None:
+            return self._transcribe(audio)
+        
+        model = self._model
+        if self._batched is None or self._batched.model is not model:
+            self._batched = pipeline_class(model=model)
+        
+        language = self.config.language if self.config.language != "auto" else None
+        segments, _ = self._batched.transcribe(
+            audio,
+            language=language,
+            batch_size=self.BATCH_SIZE,
+            beam_size=getattr(self.config, 'beam_size', 1)
+        )
+        return "".join(segment.text for segment in segments).strip()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Create the decode thread pool on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._pool_size(), thread_name_prefix="stt"
+            )
+        return self._pool
+
+    @staticmethod
+    def _pool_size() -> int:
+        """Number of chunks or clips decoded at once."""
+        return max(1, (os.cpu_count() or 2) // 2)
+
+    def _chunk_bounds(self, audio):
+        """
+        Yield the sample ranges transcribe_long() decodes separately.
+        
+        Each cut is placed in the last silent VAD frame between
+        MIN_CHUNK_SECONDS and LONG_CHUNK_SECONDS into the chunk, or at
+        LONG_CHUNK_SECONDS when there is no pause or no VAD.
+        
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            
+        Yields:
+            (start, end) sample indices
+        """
+        max_len = self.LONG_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+        min_len = self.MIN_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+        frame = int(self.VAD_FRAME_SECONDS * WHISPER_SAMPLE_RATE)
+        silent = self._silent_frames(audio, frame) if len(audio) > max_len else None
+        
+        start = 0
+        while len(audio) - start > max_len:
+            end = start + max_len
+            if silent is not None:
+                lo = (start + min_len) // frame
+                pauses = np.flatnonzero(silent[lo:end // frame])
+                if len(pauses):
+                    # Cut in the middle of the pause
+                    end = (lo + int(pauses[-1])) * frame + frame // 2
+            yield start, end
+            start = end
+        
+        if start < len(audio):
+            yield start, len(audio)
+
+    def _silent_frames(self, audio, frame: int):
+        """
+        Run WebRTC VAD over whole frames of the audio.
+        
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            frame: Frame length in samples
+            
+        Returns:
+            Boolean array marking frames without speech, or None if
+            webrtcvad is not installed
+        """
+        if self._vad is None:
+            from .vad import VoiceActivityDetector
+            self._vad = VoiceActivityDetector()
+        if self._vad._vad is None:
+            return None
+        
+        count = len(audio) // frame
+        pcm = np.clip(audio[:count * frame] * 32767.0, -32768, 32767).astype(np.int16)
+        # Slices of one byte view hand each frame to webrtcvad without a copy
+        view = memoryview(pcm).cast('B')
+        step = frame * 2
+        return np.fromiter(
+            (not self._vad.is_speech(view[i:i + step], WHISPER_SAMPLE_RATE) for i in range(0, count * step, step)),
+            dtype=bool,
+            count=count
+        )
+
     def change_model(self, model_name: str) -> bool:
         """
         Change the Whisper model.
@@ -190,19 +783,38 @@ class STTEngine:
         Returns:
             True if successful, False otherwise
         """
-        if not self._whisper:
-            return False
-
         try:
-            logger.info(f"Changing model to: {model_name}")
-            self.config.model = model_name
-            self._load_model()
+            # Same lock as the preload thread, so neither sees the backend
+            # or the model half set up by the other
+            with self._load_lock:
+                if not self._import_backend():
+                    return False
+                logger.info(f"Changing model to: {model_name}")
+                self.config.model = model_name
+                self._load_model()
             return self._model is not None
             
         except Exception as e:
             logger.error(f"Error changing model: {e}")
             return False
 
+    def shutdown(self):
+        """
+        Release this engine's model reference and the chunk pool.
+        
+        The shared model cache is left alone: other engines may hold the
+        same model, and the LRU evicts it once it falls out of use.
+        """
+        with self._load_lock:
+            self._model = None
+            self._batched = None
+        for pool in (self._pool, self._executor):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._executor = None
+        self._release_gpu_memory()
+
     def get_available_models(self):
         """Get list of available Whisper models."""
         return ["tiny", "base", "small", "medium", "large"]
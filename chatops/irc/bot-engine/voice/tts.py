@@ -1,90 +1,60 @@
-"""Text-to-Speech engine."""
-
-import logging
 """Text-to-Speech engine using pyttsx3."""
+import asyncio
+import contextlib
+import io
 import logging
+import os
 import queue
+import struct
+import subprocess
+import tempfile
 import threading
+import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-class TTSEngine:
-    """Text-to-Speech engine wrapper."""
+@contextlib.contextmanager
+def _scratch_wav_path():
+    """
+    Yield a path for a WAV that is written and read back once.
     
-    def __init__(self, config):
-        """Initialize TTS engine."""
-        self.config = config
-        self.engine = None
-        self._initialize_engine()
-    
-    def _initialize_engine(self):
-        """Initialize the TTS backend."""
-        try:
-            if self.config.tts_engine == "pyttsx3":
-                import pyttsx3
-                self.engine = pyttsx3.init()
-                self.engine.setProperty('rate', self.config.tts_rate)
-                self.engine.setProperty('volume', self.config.tts_volume)
-                if self.config.tts_voice:
-                    self.engine.setProperty('voice', self.config.tts_voice)
-                logger.info("pyttsx3 TTS engine initialized")
-            else:
-                logger.warning(f"Unsupported TTS engine: {self.config.tts_engine}")
-        except ImportError:
-            logger.warning("pyttsx3 not installed, TTS will not work")
+    On Linux the file is an anonymous memfd, so it never reaches a
+    filesystem; elsewhere a temporary file is used and removed afterwards.
     
-    def synthesize(self, text: str) -> bytes:
-        """
-        Convert text to audio data.
-        
-        Args:
-            text: Text to synthesize
-            
-        Returns:
-            Audio data as bytes
-        """
-        if not self.engine:
-            logger.error("TTS engine not initialized")
-            return b""
-        
+    Yields:
+        Path to the scratch file
+    """
+    if hasattr(os, 'memfd_create'):
+        fd = os.memfd_create("tts.wav")
         try:
-            # For pyttsx3, we need to use a different approach
-            # This is a placeholder - actual implementation would save to file/buffer
-            import tempfile
-            import os
-            
-            temp_file = None
-            try:
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                    temp_file = f.name
-                
-                self.engine.save_to_file(text, temp_file)
-                self.engine.runAndWait()
-                
-                with open(temp_file, 'rb') as f:
-                    audio_data = f.read()
-                
-                return audio_data
-            finally:
-                if temp_file and os.path.exists(temp_file):
-                    os.unlink(temp_file)
-        except Exception as e:
-            logger.error(f"TTS synthesis failed: {e}")
-            return b""
+            # Addressed by pid so a driver subprocess can open it too
+            yield f"/proc/{os.getpid()}/fd/{fd}"
+        finally:
+            os.close(fd)
+        return
     
-    def speak_directly(self, text: str):
-        """Speak text directly without returning audio data."""
-        if self.engine:
-            try:
-                self.engine.say(text)
-                self.engine.runAndWait()
-            except Exception as e:
-                logger.error(f"Direct speech failed: {e}")
-    """Text-to-speech engine using pyttsx3 for local TTS."""
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+        temp_file = f.name
+    try:
+        yield temp_file
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
 
+class TTSEngine:
+    """Text-to-Speech engine wrapper."""
+    
+    # Total size of synthesized audio kept for repeated phrases
+    _CACHE_MAX_BYTES = 16 * 1024 * 1024
+    # Queued utterances handed to pyttsx3 in one runAndWait()
+    _BATCH_MAX = 8
+    
     def __init__(self, config):
         """Initialize TTS engine."""
         self.config = config
@@ -93,6 +63,21 @@ class TTSEngine:
         self._worker_thread = None
         self._running = False
         self._lock = threading.Lock()
+        self._piper = None
+        self._espeak = None
+        self._pyttsx3 = None
+        self._executor = None
+        # synthesize() results keyed by text and voice settings
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+        
+        if getattr(config, 'engine', 'pyttsx3') == "piper":
+            self._initialize_piper()
+            return
+        if getattr(config, 'engine', 'pyttsx3') == "espeak":
+            self._initialize_espeak()
+            return
         
         # Try to import and initialize pyttsx3
         try:
@@ -113,6 +98,46 @@ class TTSEngine:
             logger.error(f"Error initializing TTS engine: {e}")
             self._pyttsx3 = None
 
+    def _initialize_piper(self):
+        """Load the Piper voice and start the queue worker."""
+        try:
+            # Neural TTS on ONNX Runtime that renders in process, with no
+            # driver subprocess or WAV file per utterance
+            from piper.voice import PiperVoice
+            self._piper = PiperVoice.load(self.config.model_path)
+            
+            self._running = True
+            self._worker_thread = threading.Thread(target=self._process_queue, daemon=True)
+            self._worker_thread.start()
+            
+            logger.info(f"Piper TTS voice loaded: {self.config.model_path}")
+        except ImportError:
+            logger.warning("piper-tts not installed, TTS will not be available")
+        except Exception as e:
+            logger.error(f"Error loading Piper voice: {e}")
+            self._piper = None
+
+    def _initialize_espeak(self):
+        """Set up espeak-ng and start the queue worker."""
+        try:
+            from espeakng import ESpeakNG
+            self._espeak = ESpeakNG()
+            self._espeak.speed = self.config.rate
+            self._espeak.volume = int(self.config.volume * 100)
+            if self.config.voice:
+                self._espeak.voice = self.config.voice
+            
+            self._running = True
+            self._worker_thread = threading.Thread(target=self._process_queue, daemon=True)
+            self._worker_thread.start()
+            
+            logger.info("espeak-ng TTS engine initialized")
+        except ImportError:
+            logger.warning("py-espeak-ng not installed, TTS will not be available")
+        except Exception as e:
+            logger.error(f"Error initializing espeak-ng: {e}")
+            self._espeak = None
+
     def _initialize_engine(self):
         """Initialize the pyttsx3 engine with configuration."""
         if not self._pyttsx3:
@@ -139,21 +164,269 @@ class TTSEngine:
         except Exception as e:
             logger.error(f"Error configuring TTS engine: {e}")
             self._engine = None
+    
+    def synthesize(self, text: str) -> bytes:
+        """
+        Convert text to audio data.
+        
+        Bots repeat many phrases, so results are cached by text and the
+        voice settings, evicting least recently used audio past
+        _CACHE_MAX_BYTES.
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            Audio data as bytes
+        """
+        key = (
+            text,
+            getattr(self.config, 'engine', 'pyttsx3'),
+            getattr(self.config, 'model_path', None),
+            self.config.voice,
+            self.config.rate,
+            self.config.volume,
+        )
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
+        audio_data = self._render(text)
+        if not audio_data or len(audio_data) > self._CACHE_MAX_BYTES:
+            return audio_data
+        
+        with self._cache_lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_bytes -= len(previous)
+            self._cache[key] = audio_data
+            self._cache_bytes += len(audio_data)
+            while self._cache_bytes > self._CACHE_MAX_BYTES:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+        
+        return audio_data
+    
+    async def synthesize_async(self, text: str) -> bytes:
+        """
+        Convert text to audio data without blocking the event loop.
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            Audio data as bytes
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-async")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.synthesize, text)
+    
+    def _render(self, text: str) -> bytes:
+        """
+        Synthesize text with the configured backend, bypassing the cache.
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            Audio data as bytes, or b"" on failure
+        """
+        if self._piper:
+            try:
+                return self._synthesize_piper(text)
+            except Exception as e:
+                logger.error(f"TTS synthesis failed: {e}")
+                return b""
+        
+        if self._espeak:
+            try:
+                return self._synthesize_espeak(text)
+            except Exception as e:
+                logger.error(f"TTS synthesis failed: {e}")
+                return b""
+        
+        if not self._engine:
+            logger.error("TTS engine not initialized")
+            return b""
+        
+        try:
+            # pyttsx3 can only render to a file, so give it one in memory
+            with _scratch_wav_path() as wav_path:
+                with self._lock:
+                    self._engine.save_to_file(text, wav_path)
+                    self._engine.runAndWait()
+                
+                with open(wav_path, 'rb') as f:
+                    return f.read()
+        except Exception as e:
+            logger.error(f"TTS synthesis failed: {e}")
+            return b""
+    
+    def _synthesize_piper(self, text: str) -> bytes:
+        """
+        Render text to WAV bytes with Piper, entirely in memory.
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            16-bit mono WAV bytes
+        """
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_file:
+            # Sets the WAV format from the voice config before writing
+            self._piper.synthesize_wav(text, wav_file)
+        return buffer.getvalue()
+    
+    def _synthesize_espeak(self, text: str) -> bytes:
+        """
+        Render text to WAV bytes with espeak-ng, read from its stdout.
+        
+        ESpeakNG.synth_wav() renders through a temporary file, so the
+        binary is run directly with --stdout instead.
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            16-bit mono WAV bytes
+        """
+        # Text is read from stdin as UTF-8
+        args = [
+            'espeak-ng', '--stdout', '-b', '1',
+            '-s', str(self.config.rate),
+            '-a', str(int(self.config.volume * 100)),
+        ]
+        if self.config.voice:
+            args += ['-v', self.config.voice]
+        
+        result = subprocess.run(
+            args,
+            input=text.encode('utf-8'),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+        wav = bytearray(result.stdout)
+        # A pipe cannot be seeked, so espeak-ng leaves placeholder sizes
+        # in the header; fill in the real ones
+        if len(wav) >= 44 and wav[:4] == b'RIFF' and wav[36:40] == b'data':
+            struct.pack_into('<I', wav, 4, len(wav) - 8)
+            struct.pack_into('<I', wav, 40, len(wav) - 44)
+        return bytes(wav)
+    
+    def _play_piper(self, text: str):
+        """
+        Speak text with Piper, playing audio as each sentence is rendered.
+        
+        Args:
+            text: Text to speak
+        """
+        # sounddevice loads PortAudio on import, so it stays lazy
+        import sounddevice as sd
+        with sd.RawOutputStream(
+            samplerate=self._piper.config.sample_rate,
+            channels=1,
+            dtype='int16'
+        ) as stream:
+            for chunk in self._piper.synthesize(text):
+                stream.write(chunk.audio_int16_bytes)
+    
+    def speak_directly(self, text: str):
+        """Speak text directly without returning audio data."""
+        try:
+            if self._piper:
+                self._play_piper(text)
+            elif self._espeak:
+                self._espeak.say(text, sync=True)
+            elif self._engine:
+                with self._lock:
+                    self._engine.say(text)
+                    self._engine.runAndWait()
+        except Exception as e:
+            logger.error(f"Direct speech failed: {e}")
 
     def _process_queue(self):
         """Worker thread to process speech queue."""
         while self._running:
             try:
-                text, save_file = self._speech_queue.get(timeout=1)
-                self._speak_internal(text, save_file)
-                self._speech_queue.task_done()
+                batch = [self._speech_queue.get(timeout=1)]
             except queue.Empty:
                 continue
+            
+            # Take whatever else is already waiting so pyttsx3 pays its
+            # runAndWait() startup once for the whole batch
+            while len(batch) < self._BATCH_MAX:
+                try:
+                    batch.append(self._speech_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                if self._engine and len(batch) > 1:
+                    self._speak_batch(batch)
+                else:
+                    for text, save_file in batch:
+                        self._speak_internal(text, save_file)
             except Exception as e:
                 logger.error(f"Error processing speech queue: {e}")
+            finally:
+                for _ in batch:
+                    self._speech_queue.task_done()
+
+    def _speak_batch(self, batch):
+        """
+        Queue several utterances on pyttsx3 and run them in one loop.
+        
+        Args:
+            batch: List of (text, save_file) tuples, spoken in order
+        """
+        try:
+            with self._lock:
+                for text, save_file in batch:
+                    if save_file:
+                        output_path = Path(self.config.output_dir) / save_file
+                        output_path.parent.mkdir(parents=True, exist_ok=True)
+                        self._engine.save_to_file(text, str(output_path))
+                    else:
+                        self._engine.say(text)
+                self._engine.runAndWait()
+            logger.info(f"Spoke {len(batch)} queued utterances")
+        except Exception as e:
+            logger.error(f"Error in speech synthesis: {e}")
 
     def _speak_internal(self, text: str, save_file: Optional[str] = None):
         """Internal method to perform actual speech synthesis."""
+        if self._piper:
+            try:
+                if save_file:
+                    output_path = Path(self.config.output_dir) / save_file
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    output_path.write_bytes(self._synthesize_piper(text))
+                    logger.info(f"Saved TTS to file: {output_path}")
+                else:
+                    self._play_piper(text)
+            except Exception as e:
+                logger.error(f"Error in speech synthesis: {e}")
+            return
+        
+        if self._espeak:
+            try:
+                if save_file:
+                    output_path = Path(self.config.output_dir) / save_file
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    output_path.write_bytes(self.synthesize(text))
+                    logger.info(f"Saved TTS to file: {output_path}")
+                else:
+                    # Played by espeak-ng as it is synthesized
+                    self._espeak.say(text, sync=True)
+            except Exception as e:
+                logger.error(f"Error in speech synthesis: {e}")
+            return
+        
         if not self._engine:
             logger.warning("TTS engine not available")
             return
@@ -186,7 +459,7 @@ class TTSEngine:
         Returns:
             True if queued successfully, False otherwise
         """
-        if not self._engine:
+        if not self._engine and not self._piper and not self._espeak:
             logger.warning("TTS engine not available, cannot speak")
             return False
 
@@ -299,6 +572,10 @@ class TTSEngine:
         if self._worker_thread and self._worker_thread.is_alive():
             self._worker_thread.join(timeout=2)
         
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        
         if self._engine:
             try:
                 self._engine.stop()
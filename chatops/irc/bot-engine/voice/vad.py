@@ -1,12 +1,12 @@
-"""Voice Activity Detection module."""
-
-import logging
-from typing import Optional
-import numpy as np
 """Voice Activity Detection using WebRTC VAD."""
 import logging
 from typing import Optional
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,29 +18,44 @@ class VAD:
         self.config = config
         self.threshold = config.silence_threshold
         self.silence_duration = config.silence_duration
+        self.sample_rate = getattr(config, 'sample_rate', 16000)
+        
+        # WebRTC VAD decides whole 10, 20 or 30 ms frames; other chunk sizes
+        # and installs without webrtcvad fall back to the RMS threshold
+        self._webrtc = VoiceActivityDetector(getattr(config, 'vad_aggressiveness', 2))
+        if self._webrtc._vad is not None and self.sample_rate in (8000, 16000, 32000, 48000):
+            self._frame_sizes = {self.sample_rate * ms // 1000 * 2 for ms in (10, 20, 30)}
+        else:
+            self._frame_sizes = set()
         logger.info("VAD initialized")
     
-    def is_speech(self, audio_chunk: bytes) -> bool:
+    def is_speech(self, audio_chunk) -> bool:
         """
         Determine if audio chunk contains speech.
         
         Args:
-            audio_chunk: Audio data bytes
+            audio_chunk: int16 audio at config.sample_rate, as bytes or
+                another bytes-like object, or an ndarray used without copying
             
         Returns:
             True if speech detected
         """
         try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
-            
-            # Calculate RMS (Root Mean Square) energy
-            rms = np.sqrt(np.mean(audio_array**2))
-            
-            # Normalize to 0-1 range
-            normalized_rms = rms / 32768.0
-            
-            return normalized_rms > self.threshold
+            if isinstance(audio_chunk, np.ndarray):
+                audio_array = audio_chunk
+                # Byte view for webrtcvad; copies only non-contiguous input
+                audio_chunk = memoryview(np.ascontiguousarray(audio_array, dtype=np.int16)).cast('B')
+            else:
+                audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
+            
+            if len(audio_chunk) in self._frame_sizes:
+                return self._webrtc.is_speech(audio_chunk, self.sample_rate)
+            
+            # RMS / 32768 > threshold, compared as squared energy so the sum
+            # of squares is one BLAS dot product with no sqrt or temporary
+            samples = audio_array.astype(np.float32)
+            energy = float(np.dot(samples, samples))
+            return energy > (self.threshold * 32768.0) ** 2 * samples.size
         except Exception as e:
             logger.error(f"VAD error: {e}")
             return False
@@ -58,35 +73,37 @@ class VAD:
         """
         try:
             audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            
-            # Process in chunks
-            chunk_samples = int(sample_rate * 0.1)  # 100ms chunks
-            segments = []
-            in_speech = False
-            segment_start = None
-            
-            for i in range(0, len(audio_array), chunk_samples):
-                chunk = audio_array[i:i+chunk_samples]
-                if len(chunk) == 0:
-                    break
-                
-                is_speech = self.is_speech(chunk.tobytes())
-                
-                if is_speech and not in_speech:
-                    segment_start = i / sample_rate
-                    in_speech = True
-                elif not is_speech and in_speech:
-                    segment_end = i / sample_rate
-                    segments.append((segment_start, segment_end))
-                    in_speech = False
-            
-            # Close last segment if still in speech
-            if in_speech:
-                segments.append((segment_start, len(audio_array) / sample_rate))
-            
-            return segments
+            if len(audio_array) == 0:
+                return []
+            
+            # Energy of every 100ms chunk (the last one may be shorter) as
+            # row-wise dot products, compared squared like is_speech
+            chunk_samples = int(sample_rate * 0.1)
+            samples = audio_array.astype(np.float32)
+            whole = len(samples) // chunk_samples * chunk_samples
+            frames = samples[:whole].reshape(-1, chunk_samples)
+            energy = np.einsum('ij,ij->i', frames, frames)
+            counts = np.full(len(energy), chunk_samples)
+            if whole < len(samples):
+                tail = samples[whole:]
+                energy = np.append(energy, np.dot(tail, tail))
+                counts = np.append(counts, len(tail))
+            speech = energy > (self.threshold * 32768.0) ** 2 * counts
+            
+            # Segment boundaries are where the speech mask flips
+            edges = np.diff(speech.astype(np.int8), prepend=0, append=0)
+            starts = np.flatnonzero(edges == 1) * chunk_samples
+            ends = np.minimum(np.flatnonzero(edges == -1) * chunk_samples, len(audio_array))
+            
+            return [
+                (start / sample_rate, end / sample_rate)
+                for start, end in zip(starts.tolist(), ends.tolist())
+            ]
         except Exception as e:
             logger.error(f"Failed to get speech segments: {e}")
+            return []
+
+
 class VoiceActivityDetector:
     """Voice Activity Detector using WebRTC VAD."""
 
@@ -115,7 +132,8 @@ class VoiceActivityDetector:
         Check if audio frame contains speech.
         
         Args:
-            audio_frame: Audio data as bytes
+            audio_frame: Audio data as bytes or another contiguous bytes-like
+                object, such as a memoryview over a reusable buffer
             sample_rate: Sample rate (8000, 16000, 32000, or 48000)
             
         Returns:
@@ -132,16 +150,16 @@ class VoiceActivityDetector:
                 logger.warning(f"Unsupported sample rate: {sample_rate}, using 16000")
                 sample_rate = 16000
             
-            # Frame length must be 10, 20, or 30 ms
-            # Calculate expected frame size
-            frame_duration = 20  # ms
-            frame_size = int(sample_rate * frame_duration / 1000) * 2  # *2 for 16-bit audio
-            
-            # Pad or trim frame to correct size
-            if len(audio_frame) < frame_size:
-                audio_frame = audio_frame + b'\x00' * (frame_size - len(audio_frame))
-            elif len(audio_frame) > frame_size:
-                audio_frame = audio_frame[:frame_size]
+            # Frame length must be 10, 20, or 30 ms; other sizes are
+            # padded or trimmed to 20 ms
+            valid_sizes = {sample_rate * ms // 1000 * 2 for ms in (10, 20, 30)}  # *2 for 16-bit audio
+            if len(audio_frame) not in valid_sizes:
+                audio_frame = bytes(audio_frame)
+                frame_size = int(sample_rate * 20 / 1000) * 2
+                if len(audio_frame) < frame_size:
+                    audio_frame = audio_frame + b'\x00' * (frame_size - len(audio_frame))
+                else:
+                    audio_frame = audio_frame[:frame_size]
             
             return self._vad.is_speech(audio_frame, sample_rate)
             
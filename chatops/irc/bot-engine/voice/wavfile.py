@@ -0,0 +1,49 @@
+"""RIFF/WAVE parsing shared by the player and the voice cloners."""
+import struct
+from typing import Optional, Tuple
+
+
+def find_pcm_data(buf) -> Optional[Tuple[int, int, int, int, int, int]]:
+    """
+    Locate the format and the sample data of a WAV file held in a buffer.
+
+    Only the chunk headers are read, so the samples can then be viewed in
+    place (np.frombuffer, torch.frombuffer) without a decoder.
+
+    Args:
+        buf: Bytes-like object or mmap with the whole file
+
+    Returns:
+        Tuple of (audio format, channels, sample rate, bits per sample,
+        data offset, data size in bytes), or None if buf is not a WAV file
+        or has no format chunk before its data. The data size is clipped
+        to what buf actually holds.
+
+    Raises:
+        ValueError: If buf is too short to hold a RIFF header
+    """
+    if len(buf) < 12:
+        raise ValueError(f"WAV data too short: {len(buf)} bytes")
+
+    riff, _, wave_id = struct.unpack_from('<4sI4s', buf, 0)
+    if riff != b'RIFF' or wave_id != b'WAVE':
+        return None
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(buf):
+        chunk_id, size = struct.unpack_from('<4sI', buf, offset)
+        body = offset + 8
+        if chunk_id == b'fmt ':
+            if body + 16 > len(buf):
+                return None
+            fmt = struct.unpack_from('<HHIIHH', buf, body)
+        elif chunk_id == b'data':
+            if fmt is None:
+                return None
+            audio_format, channels, rate, _, _, bits = fmt
+            return audio_format, channels, rate, bits, body, min(size, len(buf) - body)
+        # Chunks are padded to an even length
+        offset = body + size + (size & 1)
+
+    return None
@@ -0,0 +1,107 @@
+"""Tests for the voice cloning file helpers.
+
+Kept apart from test_base.py so they only load voice/cloning/base.py.
+"""
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+voice_cloning_base = load_module("voice.cloning.base", bot_engine_path / "voice" / "cloning" / "base.py")
+
+
+class TestFastCopy(unittest.TestCase):
+    """Test the fast_copy helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.temp_dir, "source.wav")
+        with open(self.src, 'wb') as f:
+            f.write(b"test audio data")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_fast_copy(self):
+        """Test copying preserves file contents."""
+        dst = os.path.join(self.temp_dir, "dest.wav")
+        voice_cloning_base.fast_copy(self.src, dst)
+
+        with open(dst, 'rb') as f:
+            self.assertEqual(f.read(), b"test audio data")
+
+    def test_fast_copy_replaces_existing(self):
+        """Test copying over an existing destination."""
+        dst = os.path.join(self.temp_dir, "dest.wav")
+        with open(dst, 'wb') as f:
+            f.write(b"stale")
+
+        voice_cloning_base.fast_copy(self.src, dst)
+
+        with open(dst, 'rb') as f:
+            self.assertEqual(f.read(), b"test audio data")
+
+
+class TestEnsureDir(unittest.TestCase):
+    """Test the ensure_dir helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_ensure_dir_creates_nested(self):
+        """Test nested directories are created."""
+        path = os.path.join(self.temp_dir, "a", "b")
+        voice_cloning_base.ensure_dir(path)
+
+        self.assertTrue(os.path.isdir(path))
+
+    def test_ensure_dir_existing(self):
+        """Test an existing directory and its contents are left alone."""
+        path = os.path.join(self.temp_dir, "existing")
+        os.makedirs(path)
+        marker = os.path.join(path, "marker")
+        open(marker, 'w').close()
+
+        voice_cloning_base.ensure_dir(path)
+
+        self.assertTrue(os.path.isfile(marker))
+
+    def test_ensure_dir_recreates_after_rmtree(self):
+        """Test a directory removed after creation is created again."""
+        path = os.path.join(self.temp_dir, "recreated", "voice")
+        voice_cloning_base.ensure_dir(path)
+        shutil.rmtree(os.path.join(self.temp_dir, "recreated"))
+
+        voice_cloning_base.ensure_dir(path)
+
+        self.assertTrue(os.path.isdir(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
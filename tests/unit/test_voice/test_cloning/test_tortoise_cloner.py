@@ -0,0 +1,91 @@
+"""Tests for the Tortoise cloner."""
+import unittest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+wavfile = load_module("voice.wavfile", bot_engine_path / "voice" / "wavfile.py")
+cloning_base = load_module("voice.cloning.base", bot_engine_path / "voice" / "cloning" / "base.py")
+tortoise = load_module("voice.cloning.tortoise_cloner", bot_engine_path / "voice" / "cloning" / "tortoise_cloner.py")
+
+TortoiseCloner = tortoise.TortoiseCloner
+
+
+def words(n: int) -> str:
+    """Text of n words."""
+    return " ".join(["word"] * n)
+
+
+class TestSelectPreset(unittest.TestCase):
+    """Test TortoiseCloner._select_preset."""
+
+    def make_cloner(self, preset: str) -> TortoiseCloner:
+        """Create a cloner configured with the given preset."""
+        return TortoiseCloner(SimpleNamespace(
+            device="cpu",
+            tortoise_model="tortoise",
+            tortoise_preset=preset
+        ))
+
+    def test_short_text_ultra_fast(self):
+        """Test short text uses ultra_fast with the short settings."""
+        cloner = self.make_cloner("standard")
+
+        preset, settings = cloner._select_preset(words(TortoiseCloner.SHORT_TEXT_WORDS - 1))
+
+        self.assertEqual(preset, "ultra_fast")
+        self.assertEqual(settings, TortoiseCloner.SHORT_TEXT_SETTINGS)
+        # Must stay at least one autoregressive batch, so keep the preset's
+        self.assertNotIn("num_autoregressive_samples", settings)
+
+    def test_medium_text_fast(self):
+        """Test medium text uses the fast preset."""
+        cloner = self.make_cloner("high_quality")
+
+        self.assertEqual(
+            cloner._select_preset(words(TortoiseCloner.SHORT_TEXT_WORDS)),
+            ("fast", {})
+        )
+
+    def test_long_text_configured(self):
+        """Test long text uses the configured preset."""
+        cloner = self.make_cloner("high_quality")
+
+        self.assertEqual(
+            cloner._select_preset(words(TortoiseCloner.MEDIUM_TEXT_WORDS)),
+            ("high_quality", {})
+        )
+
+    def test_never_slower_than_configured(self):
+        """Test a faster configured preset is not upgraded."""
+        cloner = self.make_cloner("ultra_fast")
+
+        self.assertEqual(cloner._select_preset(words(30)), ("ultra_fast", {}))
+
+    def test_unknown_preset_downgraded(self):
+        """Test an unknown configured preset still gets the faster presets."""
+        cloner = self.make_cloner("custom")
+
+        preset, _ = cloner._select_preset(words(3))
+
+        self.assertEqual(preset, "ultra_fast")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,7 @@ def load_module(name, path):
 bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
 voice_base = load_module("voice.base", bot_engine_path / "voice" / "base.py")
 voice_profile_module = load_module("voice.cloning.voice_profile", bot_engine_path / "voice" / "cloning" / "voice_profile.py")
+wavfile = load_module("voice.wavfile", bot_engine_path / "voice" / "wavfile.py")
 cloning_base = load_module("voice.cloning.base", bot_engine_path / "voice" / "cloning" / "base.py")
 xtts = load_module("voice.cloning.xtts_cloner", bot_engine_path / "voice" / "cloning" / "xtts_cloner.py")
 tortoise = load_module("voice.cloning.tortoise_cloner", bot_engine_path / "voice" / "cloning" / "tortoise_cloner.py")
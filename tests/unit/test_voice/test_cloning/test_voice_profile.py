@@ -1,5 +1,6 @@
 """Tests for voice profile management."""
 import unittest
+from unittest.mock import patch
 import os
 import sys
 import tempfile
@@ -89,6 +90,52 @@ class TestVoiceProfile(unittest.TestCase):
         self.assertEqual(loaded.engine, self.profile.engine)
         self.assertEqual(loaded.sample_files, self.profile.sample_files)
     
+    def test_slots(self):
+        """Test profiles carry no per-instance __dict__."""
+        self.assertFalse(hasattr(self.profile, "__dict__"))
+        
+        with self.assertRaises(AttributeError):
+            self.profile.unknown_field = True
+    
+    def test_save_leaves_no_temp_file(self):
+        """Test saving replaces the profile without leftover temp files."""
+        self.profile.save(self.temp_dir)
+        self.profile.save(self.temp_dir)
+        
+        self.assertEqual(os.listdir(self.temp_dir), ["test-profile.json"])
+    
+    def test_save_syncs_before_replace(self):
+        """Test the profile data is flushed to disk before it is published."""
+        calls = []
+        with patch.object(voice_profile_module.os, "fsync",
+                          side_effect=lambda fd: calls.append("fsync")), \
+             patch.object(voice_profile_module.os, "replace",
+                          side_effect=lambda *a: calls.append("replace") or os.rename(*a)):
+            self.profile.save(self.temp_dir)
+        
+        self.assertEqual(calls, ["fsync", "replace"])
+    
+    def test_save_failure_keeps_previous(self):
+        """Test a failed save leaves the previous profile and no temp file."""
+        self.profile.save(self.temp_dir)
+        self.profile.model_path = "/path/to/other"
+        
+        with patch.object(voice_profile_module, "_dumps", side_effect=ValueError("bad")):
+            with self.assertRaises(ValueError):
+                self.profile.save(self.temp_dir)
+        
+        self.assertEqual(os.listdir(self.temp_dir), ["test-profile.json"])
+        loaded = VoiceProfile.load("test-profile", self.temp_dir)
+        self.assertEqual(loaded.model_path, "/path/to/model")
+    
+    def test_save_and_load_without_orjson(self):
+        """Test the stdlib json fallback round-trips a profile."""
+        with patch.object(voice_profile_module, "ORJSON_AVAILABLE", False):
+            self.profile.save(self.temp_dir)
+            loaded = VoiceProfile.load("test-profile", self.temp_dir)
+        
+        self.assertEqual(loaded.to_dict(), self.profile.to_dict())
+    
     def test_load_nonexistent(self):
         """Test loading nonexistent profile raises error."""
         with self.assertRaises(FileNotFoundError):
@@ -209,6 +256,83 @@ class TestVoiceProfileManager(unittest.TestCase):
     def test_set_master_voice_nonexistent(self):
         """Test setting nonexistent profile as master."""
         self.assertFalse(self.manager.set_master_voice("nonexistent"))
+    
+    def test_set_master_voice_nonexistent_keeps_master(self):
+        """Test a failed switch leaves the current master in place."""
+        self.profile1.save(self.temp_dir)
+        self.profile2.save(self.temp_dir)
+        
+        self.assertFalse(self.manager.set_master_voice("nonexistent"))
+        
+        master = self.manager.get_master_voice()
+        self.assertEqual(master.name, "profile2")
+
+    def test_get_profile_cached(self):
+        """Test unchanged profiles are served from the cache."""
+        self.profile1.save(self.temp_dir)
+        self.manager.get_profile("profile1")
+        
+        with patch.object(voice_profile_module, "_loads") as loads:
+            profile = self.manager.get_profile("profile1")
+            loads.assert_not_called()
+        self.assertEqual(profile.model_path, "/path/to/model1")
+    
+    def test_get_profile_returns_copies(self):
+        """Test changing a returned profile does not change the cache."""
+        self.profile1.save(self.temp_dir)
+        
+        first = self.manager.get_profile("profile1")
+        first.is_master = True
+        first.sample_files.append("extra.wav")
+        
+        second = self.manager.get_profile("profile1")
+        self.assertIsNot(first, second)
+        self.assertFalse(second.is_master)
+        self.assertEqual(second.sample_files, ["sample1.wav"])
+    
+    def test_get_profile_reloads_when_changed(self):
+        """Test a profile rewritten on disk is reloaded."""
+        self.profile1.save(self.temp_dir)
+        self.manager.get_profile("profile1")
+        
+        self.profile1.model_path = "/path/to/updated_model"
+        self.profile1.save(self.temp_dir)
+        
+        profile = self.manager.get_profile("profile1")
+        self.assertEqual(profile.model_path, "/path/to/updated_model")
+    
+    def test_set_master_voice_saves_only_changed(self):
+        """Test only the old and new master profiles are rewritten."""
+        self.profile1.save(self.temp_dir)
+        self.profile2.save(self.temp_dir)
+        profile3 = VoiceProfile(
+            name="profile3",
+            engine="xtts",
+            created_at=datetime.now(),
+            sample_files=["sample3.wav"],
+            model_path="/path/to/model3"
+        )
+        profile3.save(self.temp_dir)
+        
+        with patch.object(VoiceProfile, "save", autospec=True,
+                          side_effect=VoiceProfile.save) as save:
+            self.assertTrue(self.manager.set_master_voice("profile1"))
+        
+        saved = sorted(call.args[0].name for call in save.call_args_list)
+        self.assertEqual(saved, ["profile1", "profile2"])
+    
+    def test_set_master_voice_failed_save_keeps_cache(self):
+        """Test a failed save leaves the cached profiles unchanged."""
+        self.profile1.save(self.temp_dir)
+        self.profile2.save(self.temp_dir)
+        self.manager.list_profiles()
+        
+        with patch.object(VoiceProfile, "save", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.manager.set_master_voice("profile1")
+        
+        self.assertTrue(self.manager.get_profile("profile2").is_master)
+        self.assertFalse(self.manager.get_profile("profile1").is_master)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,132 @@
+"""Tests for audio player helpers."""
+import unittest
+from unittest.mock import patch
+import mmap
+import os
+import sys
+import tempfile
+import shutil
+import wave
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+wavfile = load_module("voice.wavfile", bot_engine_path / "voice" / "wavfile.py")
+player_module = load_module("voice.player", bot_engine_path / "voice" / "player.py")
+
+AudioPlayer = player_module.AudioPlayer
+
+
+def write_wav(path, frames: bytes, channels: int = 1, sample_rate: int = 16000, width: int = 2):
+    """Write PCM frames to a WAV file."""
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(width)
+        wf.setframerate(sample_rate)
+        wf.writeframes(frames)
+
+
+def mapped_base(array):
+    """Return the object at the bottom of an array's base chain."""
+    base = array
+    while getattr(base, 'base', None) is not None:
+        base = base.base
+    if isinstance(base, memoryview):
+        base = base.obj
+    return base
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestMapWav(unittest.TestCase):
+    """Test AudioPlayer._map_wav."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "clip.wav")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_mono(self):
+        """Test mono samples and sample rate are read."""
+        samples = np.array([0, 1, -1, 32767, -32768], dtype='<i2')
+        write_wav(self.path, samples.tobytes(), sample_rate=22050)
+
+        audio, sample_rate = AudioPlayer._map_wav(self.path)
+
+        self.assertEqual(sample_rate, 22050)
+        np.testing.assert_array_equal(audio, samples)
+
+    def test_stereo_shape(self):
+        """Test interleaved stereo is shaped (frames, channels)."""
+        samples = np.arange(8, dtype='<i2')
+        write_wav(self.path, samples.tobytes(), channels=2)
+
+        audio, _ = AudioPlayer._map_wav(self.path)
+
+        self.assertEqual(audio.shape, (4, 2))
+        np.testing.assert_array_equal(audio[:, 1], [1, 3, 5, 7])
+
+    def test_unsupported_width(self):
+        """Test non-16-bit WAVs are left to the general decoder."""
+        write_wav(self.path, bytes(8), width=1)
+
+        self.assertIsNone(AudioPlayer._map_wav(self.path))
+
+    def test_not_wav(self):
+        """Test non-WAV and empty files are rejected."""
+        with open(self.path, 'wb') as f:
+            f.write(b"ID3\x04" + bytes(64))
+        self.assertIsNone(AudioPlayer._map_wav(self.path))
+
+        open(self.path, 'wb').close()
+        self.assertIsNone(AudioPlayer._map_wav(self.path))
+
+    def test_small_clip_copied(self):
+        """Test small clips are unaffected by later changes to the file."""
+        samples = np.arange(16, dtype='<i2')
+        write_wav(self.path, samples.tobytes())
+
+        audio, _ = AudioPlayer._map_wav(self.path)
+        self.assertNotIsInstance(mapped_base(audio), mmap.mmap)
+
+        with open(self.path, 'r+b') as f:
+            f.truncate(0)
+        np.testing.assert_array_equal(audio, samples)
+
+    def test_large_clip_mapped(self):
+        """Test clips at or above the threshold are memory-mapped."""
+        samples = np.arange(16, dtype='<i2')
+        write_wav(self.path, samples.tobytes())
+
+        with patch.object(AudioPlayer, "_MAP_MIN_BYTES", 0):
+            audio, _ = AudioPlayer._map_wav(self.path)
+
+        self.assertIsInstance(mapped_base(audio), mmap.mmap)
+        np.testing.assert_array_equal(audio, samples)
+
+
+if __name__ == '__main__':
+    unittest.main()
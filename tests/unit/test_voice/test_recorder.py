@@ -0,0 +1,80 @@
+"""Tests for audio recorder helpers."""
+import unittest
+import io
+import sys
+import wave
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+recorder_module = load_module("voice.recorder", bot_engine_path / "voice" / "recorder.py")
+
+AudioRecorder = recorder_module.AudioRecorder
+
+
+class TestWavHeader(unittest.TestCase):
+    """Test AudioRecorder._wav_header."""
+
+    def test_header_size(self):
+        """Test the header is the canonical 44 bytes."""
+        self.assertEqual(len(AudioRecorder._wav_header(0, 1, 16000)), 44)
+
+    def test_header_readable(self):
+        """Test header plus samples is a WAV the stdlib reads back."""
+        frames = bytes(range(12))
+        header = AudioRecorder._wav_header(len(frames), 2, 44100)
+
+        with wave.open(io.BytesIO(header + frames), 'rb') as wf:
+            self.assertEqual(wf.getnchannels(), 2)
+            self.assertEqual(wf.getsampwidth(), 2)
+            self.assertEqual(wf.getframerate(), 44100)
+            self.assertEqual(wf.getnframes(), 3)
+            self.assertEqual(wf.readframes(3), frames)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestDownmixToMono(unittest.TestCase):
+    """Test AudioRecorder._downmix_to_mono."""
+
+    def test_stereo(self):
+        """Test stereo frames are averaged."""
+        audio = np.array([[100, 300], [-2, 4], [0, 0]], dtype=np.int16)
+
+        mixed = AudioRecorder._downmix_to_mono(audio)
+
+        self.assertEqual(mixed.dtype, np.int16)
+        np.testing.assert_array_equal(mixed, [200, 1, 0])
+
+    def test_no_overflow(self):
+        """Test full-scale channels do not wrap around."""
+        audio = np.array([[32767, 32767], [-32768, -32768]], dtype=np.int16)
+
+        np.testing.assert_array_equal(AudioRecorder._downmix_to_mono(audio), [32767, -32768])
+
+    def test_multichannel(self):
+        """Test more than two channels are averaged too."""
+        audio = np.array([[3, 6, 9, 12]], dtype=np.int16)
+
+        np.testing.assert_array_equal(AudioRecorder._downmix_to_mono(audio), [7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for speech-to-text helpers."""
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+stt_module = load_module("voice.stt", bot_engine_path / "voice" / "stt.py")
+
+STTEngine = stt_module.STTEngine
+RATE = stt_module.WHISPER_SAMPLE_RATE
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestChunkBounds(unittest.TestCase):
+    """Test STTEngine._chunk_bounds."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.engine = STTEngine(SimpleNamespace(model="base"))
+        self.max_len = STTEngine.LONG_CHUNK_SECONDS * RATE
+        self.frame = int(STTEngine.VAD_FRAME_SECONDS * RATE)
+
+    def bounds(self, seconds: float, silent=None):
+        """Collect the chunk bounds for audio of the given length."""
+        audio = np.zeros(int(seconds * RATE), dtype=np.float32)
+        with patch.object(self.engine, "_silent_frames", return_value=silent):
+            return list(self.engine._chunk_bounds(audio))
+
+    def test_short_audio(self):
+        """Test audio under the chunk length is one chunk."""
+        self.assertEqual(self.bounds(5), [(0, 5 * RATE)])
+
+    def test_empty_audio(self):
+        """Test empty audio yields nothing."""
+        self.assertEqual(self.bounds(0), [])
+
+    def test_fixed_cuts_without_vad(self):
+        """Test cuts fall every LONG_CHUNK_SECONDS without VAD."""
+        total = 70 * RATE
+        self.assertEqual(self.bounds(70), [
+            (0, self.max_len),
+            (self.max_len, 2 * self.max_len),
+            (2 * self.max_len, total),
+        ])
+
+    def test_fixed_cuts_without_pause(self):
+        """Test cuts fall every LONG_CHUNK_SECONDS when nobody pauses."""
+        total = 40 * RATE
+        silent = np.zeros(total // self.frame, dtype=bool)
+        self.assertEqual(self.bounds(40, silent), [(0, self.max_len), (self.max_len, total)])
+
+    def test_cut_in_last_pause(self):
+        """Test the cut lands mid-frame in the last pause past the minimum length."""
+        total = 40 * RATE
+        min_frame = STTEngine.MIN_CHUNK_SECONDS * RATE // self.frame
+        silent = np.zeros(total // self.frame, dtype=bool)
+        # A pause before the minimum chunk length is ignored
+        silent[min_frame - 10] = True
+        silent[min_frame + 50] = True
+        silent[min_frame + 100] = True
+
+        cut = (min_frame + 100) * self.frame + self.frame // 2
+        self.assertEqual(self.bounds(40, silent), [(0, cut), (cut, total)])
+
+
+if __name__ == '__main__':
+    unittest.main()
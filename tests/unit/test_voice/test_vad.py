@@ -0,0 +1,95 @@
+"""Tests for voice activity detection."""
+import unittest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+vad_module = load_module("voice.vad", bot_engine_path / "voice" / "vad.py")
+
+VAD = vad_module.VAD
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds: float):
+    """Loud int16 square wave well above the silence threshold."""
+    samples = np.full(int(seconds * SAMPLE_RATE), 10000, dtype=np.int16)
+    samples[::2] = -10000
+    return samples
+
+
+def silence(seconds: float):
+    """All-zero int16 samples."""
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestGetSpeechSegments(unittest.TestCase):
+    """Test VAD.get_speech_segments."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.vad = VAD(SimpleNamespace(
+            silence_threshold=0.01,
+            silence_duration=1.0,
+            sample_rate=SAMPLE_RATE
+        ))
+
+    def segments(self, *parts):
+        """Run get_speech_segments over the concatenated parts."""
+        audio = np.concatenate(parts).tobytes()
+        return self.vad.get_speech_segments(audio, SAMPLE_RATE)
+
+    def assertSegments(self, actual, expected):
+        """Compare segment lists with float tolerance."""
+        self.assertEqual(len(actual), len(expected))
+        for (start, end), (exp_start, exp_end) in zip(actual, expected):
+            self.assertAlmostEqual(start, exp_start)
+            self.assertAlmostEqual(end, exp_end)
+
+    def test_empty(self):
+        """Test empty audio has no segments."""
+        self.assertEqual(self.vad.get_speech_segments(b"", SAMPLE_RATE), [])
+
+    def test_silence(self):
+        """Test silence has no segments."""
+        self.assertEqual(self.segments(silence(1.0)), [])
+
+    def test_single_segment(self):
+        """Test speech between pauses is one segment."""
+        result = self.segments(silence(0.3), tone(0.2), silence(0.2))
+        self.assertSegments(result, [(0.3, 0.5)])
+
+    def test_multiple_segments(self):
+        """Test each run of speech is its own segment."""
+        result = self.segments(tone(0.2), silence(0.3), tone(0.1), silence(0.1))
+        self.assertSegments(result, [(0.0, 0.2), (0.5, 0.6)])
+
+    def test_speech_in_short_tail(self):
+        """Test speech running into a partial last chunk ends at the audio end."""
+        result = self.segments(silence(0.1), tone(0.15))
+        self.assertSegments(result, [(0.1, 0.25)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for the shared WAV parser."""
+import unittest
+import io
+import struct
+import sys
+import wave
+from pathlib import Path
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import modules directly from file paths due to hyphenated directory names
+import importlib.util
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Load modules
+bot_engine_path = project_root / "chatops" / "irc" / "bot-engine"
+wavfile = load_module("voice.wavfile", bot_engine_path / "voice" / "wavfile.py")
+
+find_pcm_data = wavfile.find_pcm_data
+
+
+def make_wav(frames: bytes, channels: int = 1, sample_rate: int = 16000, width: int = 2) -> bytes:
+    """Build WAV bytes with the stdlib writer."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(width)
+        wf.setframerate(sample_rate)
+        wf.writeframes(frames)
+    return buffer.getvalue()
+
+
+class TestFindPcmData(unittest.TestCase):
+    """Test find_pcm_data."""
+
+    def test_pcm16(self):
+        """Test format fields and the data location are returned."""
+        frames = bytes(range(8))
+        data = make_wav(frames, channels=2, sample_rate=22050)
+
+        audio_format, channels, rate, bits, offset, nbytes = find_pcm_data(data)
+
+        self.assertEqual((audio_format, channels, rate, bits), (1, 2, 22050, 16))
+        self.assertEqual(data[offset:offset + nbytes], frames)
+
+    def test_other_width(self):
+        """Test other sample widths are reported, not rejected."""
+        self.assertEqual(find_pcm_data(make_wav(bytes(4), width=1))[3], 8)
+
+    def test_skips_padded_chunk(self):
+        """Test odd-sized chunks before the data are skipped with their pad byte."""
+        data = make_wav(b"\x01\x00\x02\x00")
+        extra = b"LIST" + struct.pack('<I', 3) + b"abc\x00"
+        data = data[:36] + extra + data[36:]
+
+        _, _, _, _, offset, nbytes = find_pcm_data(data)
+
+        self.assertEqual(data[offset:offset + nbytes], b"\x01\x00\x02\x00")
+
+    def test_truncated_data(self):
+        """Test a data size past the end is clipped to the buffer."""
+        data = make_wav(bytes(16))[:-6]
+
+        _, _, _, _, offset, nbytes = find_pcm_data(data)
+
+        self.assertEqual(offset + nbytes, len(data))
+
+    def test_not_wav(self):
+        """Test non-WAV data returns None."""
+        self.assertIsNone(find_pcm_data(b"ID3\x04" + bytes(64)))
+
+    def test_data_before_fmt(self):
+        """Test data without a preceding format chunk returns None."""
+        data = b"RIFF" + struct.pack('<I', 16) + b"WAVE" + b"data" + struct.pack('<I', 4) + bytes(4)
+
+        self.assertIsNone(find_pcm_data(data))
+
+    def test_too_short(self):
+        """Test buffers shorter than a RIFF header raise ValueError."""
+        with self.assertRaises(ValueError):
+            find_pcm_data(b"RIFF")
+        with self.assertRaises(ValueError):
+            find_pcm_data(b"")
+
+
+if __name__ == '__main__':
+    unittest.main()